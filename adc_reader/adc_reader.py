@@ -23,10 +23,10 @@ This module relies on helper utilities:
 - `utils.radar_cli.RadarCLI` for communication with the radar EVM via mmWave CLI.
 
 Typical Usage:
-    from queue import Queue
+    from adc_reader.utils.frame_buffer import FrameBuffer
     from XWRL6432AdcReader import XWRL6432AdcReader
 
-    data_queue = Queue()
+    data_queue = FrameBuffer()
     adc_reader = XWRL6432AdcReader(
         radar_serial_port="/dev/ttyACM1",
         radar_cfg_path="path/to/your/iwrl6432.cfg",
@@ -43,8 +43,9 @@ Typical Usage:
         adc_reader.stop_acquisition()
         adc_reader.close()
 """
+import sys
 import threading
-from queue import Queue
+from queue import Queue, SimpleQueue, Empty
 from pathlib import Path
 import numpy as np
 import time
@@ -54,6 +55,43 @@ from .utils.radar_cli import RadarCLI
 from scipy.io import savemat
 
 
+def _build_rdif_lut() -> np.ndarray:
+    """
+    Builds the lookup tables for RDIF Swizzling Mode 2 unswizzling.
+
+    Each output sample S0..S3 collects three bits from each of the four
+    words W0..W3 of a 64-bit RDIF block (see _unswizzle_rdif_data for the
+    bit layout). Since a word is only 16 bits, each word lane's combined
+    contribution to all four samples can be tabulated over all 65536 word
+    values, packed as a uint64 holding the 16-bit samples side by side in
+    memory order. A whole block then unswizzles as four table gathers
+    OR-ed together, and the packed result reinterprets directly as the
+    S0 S1 S2 S3 output stream.
+
+    Returns:
+        np.ndarray: uint64 table of shape (4, 65536), 2 MB total.
+    """
+    words = np.arange(65536, dtype=np.uint64)
+    lut = np.zeros((4, 65536), dtype=np.uint64)
+    # Lane positions inside the packed uint64, in memory order: sample s
+    # occupies bits [16*s, 16*s+16) on little-endian machines (and the
+    # mirrored lanes on big-endian ones, so the uint16 view comes out in
+    # the same S0..S3 order either way)
+    sample_lanes = (0, 16, 32, 48) if sys.byteorder == 'little' else (48, 32, 16, 0)
+    for s_idx, shift in enumerate((9, 6, 3, 0)):
+        group = (words >> shift) & 0x7
+        for w_idx in range(4):
+            contribution = (((group & 1) << w_idx)
+                            | (((group >> 1) & 1) << (4 + w_idx))
+                            | (((group >> 2) & 1) << (8 + w_idx)))
+            lut[w_idx] |= contribution << sample_lanes[s_idx]
+    return lut
+
+
+# Built once at import; shared by all reader instances
+_RDIF_LUT = _build_rdif_lut()
+
+
 class AdcReader(threading.Thread):
     """
     A class to manage data acquisition from an xWRL6432 radar sensor
@@ -76,6 +114,11 @@ class AdcReader(threading.Thread):
         num_adc_samples (int):  Number of ADC samples per chirp.
         num_chirp_loops (int):  Number of chirp loops (frames / Tx antennas).
     """
+
+    # Number of preallocated output slabs circulating between reader and
+    # consumers. Sized to cover queueing jitter of a few frame periods.
+    _NUM_SLABS = 8
+
     def __init__(self, radar_serial_port: str, radar_cfg_path: str, out_queue: Queue):
         """
         Initializes the XWRL6432AdcReader.
@@ -123,7 +166,18 @@ class AdcReader(threading.Thread):
         except Exception as e:
             print(f"Failed to parse config: {e}")
             raise
-        
+
+        # Free-list of reusable output slabs. Decoding writes each frame into
+        # a recycled slab instead of allocating a fresh float32 cube per
+        # frame; consumers hand slabs back via release() once they have
+        # copied the data out, which keeps the steady state allocation-free.
+        self._slab_shape = (self.num_chirp_loops,
+                            self.num_tx_ant * self.num_rx_ant,
+                            self.num_adc_samples)
+        self._free_slabs = SimpleQueue()
+        for _ in range(self._NUM_SLABS):
+            self._free_slabs.put(np.empty(self._slab_shape, dtype=np.float32))
+
     def run(self):
         """
         Main execution method for the thread.
@@ -150,7 +204,10 @@ class AdcReader(threading.Thread):
                 last_frame_time = current_time
                 # print(f"1 frame : {time_interval_ms:.2f} ms")           
                 if raw_frame is not None:
-                    adc_data = self._interpret_raw_data(raw_frame)
+                    adc_data = self._interpret_raw_data(raw_frame, out=self._get_slab())
+                    # Interpretation copied the data out, so the raw buffer can
+                    # be recycled by the DCA1000 for a future frame
+                    self.dca.release_frame(raw_frame)
                     self.out_queue.put(adc_data)
                 elif self._running:
                     raise RuntimeError("No data from DCA read while reader was active")
@@ -235,6 +292,44 @@ class AdcReader(threading.Thread):
         return config_data
 
     
+    def _get_slab(self) -> np.ndarray:
+        """
+        Obtains an output slab for the next decoded frame.
+
+        Prefers the free pool; if every slab is in flight, reclaims the oldest
+        undelivered frame from out_queue (a stalled consumer then costs a
+        bounded gap in the stream, not unbounded allocation). Only if the
+        queue is also empty — a consumer holding slabs without releasing
+        them — does it fall back to a fresh allocation.
+
+        Returns:
+            np.ndarray: A float32 slab of shape (num_chirp_loops,
+                        num_tx_ant * num_rx_ant, num_adc_samples).
+        """
+        try:
+            return self._free_slabs.get_nowait()
+        except Empty:
+            pass
+        try:
+            return self.out_queue.get_nowait()
+        except Empty:
+            return np.empty(self._slab_shape, dtype=np.float32)
+
+    def release(self, frame: np.ndarray):
+        """
+        Returns a frame obtained from out_queue to the free slab pool.
+
+        Consumers should call this once they have copied the frame's data
+        into their own storage. Arrays that did not come from the pool
+        (wrong shape or dtype) are ignored, so callers need no special
+        casing.
+
+        Args:
+            frame (np.ndarray): The frame to recycle.
+        """
+        if frame.shape == self._slab_shape and frame.dtype == np.float32:
+            self._free_slabs.put(frame)
+
     def close(self):
         """
         Closes connections to the radar CLI and DCA1000.
@@ -281,7 +376,7 @@ class AdcReader(threading.Thread):
             self.dca = None
             raise
     
-    def _interpret_raw_data(self, raw_data):
+    def _interpret_raw_data(self, raw_data, out=None):
         """
         Processes raw ADC data from the DCA1000.
 
@@ -291,6 +386,10 @@ class AdcReader(threading.Thread):
 
         Args:
             raw_data (bytes or np.ndarray): Raw data (uint16) from the DCA1000.
+            out (np.ndarray, optional): Preallocated float32 array of the
+                                        output shape to decode into (a slab
+                                        from the free pool). Allocated fresh
+                                        if None.
 
         Returns:
             np.ndarray: Processed ADC data as a NumPy array of dtype float32,
@@ -299,26 +398,39 @@ class AdcReader(threading.Thread):
         # Perform RDIF unswizzling
         data = self._unswizzle_rdif_data(raw_data)
 
+        # Flip bit 11 in place: v ^ 0x800 maps the 12-bit unsigned range so
+        # that subtracting 2048 afterwards yields the signed value for every
+        # sample (v for v < 2048, v - 4096 otherwise) — branchless, no
+        # compare or mask passes
+        data ^= 0x800
+
         # Reshape the data into the structure it comes in
         data = np.reshape(data, [self.num_chirp_loops, self.num_tx_ant, self.num_adc_samples, self.num_rx_ant])
-        # Reformat into chirp_loops x adc_samples x tx_channel x rx_channel
-        data = np.transpose(data, [0, 2, 1, 3])
-        # Reformat into chirp_loops x adc_samples x channel
-        # Channel then is organized as: [0]tx0->rx0 | [1]tx0->rx1 | [2]tx0->rx2 | [3]tx1->rx0 | [4]tx1->rx1 | [5]tx1->rx2 
-        data = np.reshape(data, [self.num_chirp_loops, self.num_adc_samples, (self.num_tx_ant*self.num_rx_ant)])
-        # Bring it into format chirp_loops x channel x adc_samples so it is compatible with OpenRadar lib
-        data = data.swapaxes(1, 2)
-
-        # Convert the 12-bit unsigned values [0, 4095] to signed [-2048, 2047]
-        data = data.astype(np.float32)
-        max_signed_val = 2**(12 - 1) - 1 # 2047
-        # Subtract 2^12 (4096) from values which exceed the max positive to wrap them to negative
-        data[data > max_signed_val] -= 2**12
-
-        return data
+        # Reorder into chirp_loops x tx_channel x rx_channel x adc_samples
+        # (a view; nothing is moved yet). Flattening tx and rx into one
+        # channel axis then gives: [0]tx0->rx0 | [1]tx0->rx1 | [2]tx0->rx2 | [3]tx1->rx0 | ...,
+        # i.e. chirp_loops x channel x adc_samples, compatible with OpenRadar lib
+        data = np.transpose(data, [0, 1, 3, 2])
+
+        # Materialize the reordering and the cast to float32 in a single
+        # strided pass into the output slab: viewing the contiguous slab with
+        # the tx/rx axes split makes the shapes line up, so no intermediate
+        # uint16 copy of the frame is ever made
+        if out is None:
+            out = np.empty((self.num_chirp_loops,
+                            self.num_tx_ant * self.num_rx_ant,
+                            self.num_adc_samples), dtype=np.float32)
+        out_view = out.reshape(self.num_chirp_loops, self.num_tx_ant,
+                               self.num_rx_ant, self.num_adc_samples)
+        np.copyto(out_view, data)
+        # Undo the bias flip: this completes the unsigned-to-signed
+        # conversion, mapping [0, 4095] onto [-2048, 2047] in place
+        out -= 2048.0
+
+        return out
     
     @staticmethod
-    def _parse_radar_config(config_path: Path) -> tuple[int, int, int, int]:
+    def _parse_radar_config(config_path: Path) -> tuple[int, int, int, int, int]:
         """
         Parses a radar configuration file to extract essential parameters.
 
@@ -336,7 +448,6 @@ class AdcReader(threading.Thread):
         Raises:
             ValueError: If essential configuration lines are missing or malformed.
         """
-        chirps_per_frame = 0
         num_tx_ant = 0
         num_rx_ant = 0
         num_adc_samples = 0
@@ -344,29 +455,30 @@ class AdcReader(threading.Thread):
         num_bursts_per_frame = 0
         frame_period = 0
 
-        with open(config_path, 'r') as file:
-            for line in file:
-                # Strip trailing spaces
-                line = line.strip()
-
-                # Only channelCfg, chirpComnCfg and frameCfg are of interest
-                if line.startswith("channelCfg"):
-                    parts = line.split()
-                    vals = parts[1:]
-                    num_rx_ant = bin(int(vals[0])).count('1')
-                    num_tx_ant = bin(int(vals[1])).count('1')
-                    
-                elif line.startswith("chirpComnCfg"):
-                    parts = line.split()
-                    vals = parts[1:]
-                    num_adc_samples = int(vals[3])
-                    
-                elif line.startswith("frameCfg"):
-                    parts = line.split()
-                    vals = parts[1:]
-                    num_chirps_per_burst = int(vals[0])
-                    num_bursts_per_frame = int(vals[3])
-                    frame_period         = int(vals[4])
+        # Read the whole file in one go; small .cfg files are cheaper to
+        # split in memory than to decode line by line through the IO stack
+        for line in config_path.read_text().splitlines():
+            # Strip trailing spaces
+            line = line.strip()
+
+            # Only channelCfg, chirpComnCfg and frameCfg are of interest
+            if line.startswith("channelCfg"):
+                parts = line.split()
+                vals = parts[1:]
+                num_rx_ant = int(vals[0]).bit_count()
+                num_tx_ant = int(vals[1]).bit_count()
+
+            elif line.startswith("chirpComnCfg"):
+                parts = line.split()
+                vals = parts[1:]
+                num_adc_samples = int(vals[3])
+
+            elif line.startswith("frameCfg"):
+                parts = line.split()
+                vals = parts[1:]
+                num_chirps_per_burst = int(vals[0])
+                num_bursts_per_frame = int(vals[3])
+                frame_period         = int(vals[4])
         chirps_per_frame = num_chirps_per_burst * num_bursts_per_frame
         return chirps_per_frame, num_tx_ant, num_rx_ant, num_adc_samples, frame_period
     
@@ -418,8 +530,13 @@ class AdcReader(threading.Thread):
             np.ndarray: 1D NumPy array of dtype uint16 containing the unpacked
                         12-bit samples.
         """
-        # Ensure data is a NumPy array of uint16
-        raw_data = np.array(raw_data, dtype=np.uint16)
+        # Ensure data is a NumPy array of uint16 without copying: byte-like
+        # input is reinterpreted in place via frombuffer (asarray would treat
+        # it as a scalar), and uint16 arrays pass through asarray as-is
+        if isinstance(raw_data, (bytes, bytearray, memoryview)):
+            raw_data = np.frombuffer(raw_data, dtype=np.uint16)
+        else:
+            raw_data = np.asarray(raw_data, dtype=np.uint16)
 
         # Ensure data length is a multiple of 4 (RDIF uses 64 bit blocks)
         num_elements = raw_data.shape[0]
@@ -439,46 +556,17 @@ class AdcReader(threading.Thread):
         # S2 = w3_b05 | w2_b05 | w1_b05 | w0_b05 | w3_b04 | w2_b04 | w1_b04 | w0_b04 | w3_b03 | w2_b03 | w1_b03 | w0_b03
         # S3 = w3_b02 | w2_b02 | w1_b02 | w0_b02 | w3_b01 | w2_b01 | w1_b01 | w0_b01 | w3_b00 | w2_b00 | w1_b00 | w0_b00
 
-        w_arrays = [] # arrays for the 4 words (4 columns of RDIF block over all RDIF blocks)
-        s_arrays = [] # arrays for the final samples derived from the 4 columns
-
-        # Extract the four words for all chunks
-        for i in range(4):
-            w_arrays.append(data_reshaped[:, i])
-        
-        # Initialize all output sample arrays with zeros
-        for i in range(4):
-            s_arrays.append(np.zeros(num_chunks, dtype=np.uint16))
-    
-        # Bit shifts to get the 3-bit groups from input words Wi for S0, S1, S2, S3 respectively
-        input_word_group_shifts = [9, 6, 3, 0]
-
-        # Loop for each output sample type (S0, S1, S2, S3)
-        for s_idx in range(4):
-            current_input_word_bit_shift = input_word_group_shifts[s_idx]
-
-            # Extract the relevant 3-bit groups from ALL W0, W1, W2, W3 for current sample
-            bitgroups_for_current_s = [] # e.g. for S0: [ ((W0>>9)&7), ((W1>>9)&7), ((W2>>9)&7), ((W3>>9)&7) ]
-            for w_array in w_arrays:
-                three_bits_array_from_word = (w_array >> current_input_word_bit_shift) & 0x7
-                bitgroups_for_current_s.append(three_bits_array_from_word)
-
-            # Construct output samples
-            for idx_of_bit_in_3bit_group in range(3):  # iterate 0 (LSB), 1 (Mid), 2 (MSB) of the 3-bit groups
-                for source_word_idx in range(4): # iterate over bits extracted from W0, W1, W2, W3
-                    # Determine where this bit goes in the 12-bit output sample
-                    bit_pos_in_s = idx_of_bit_in_3bit_group * 4 + source_word_idx
-
-                    # Get the specific bit (0 or 1) from the current 3-bit group
-                    source_bit_val_array = (bitgroups_for_current_s[source_word_idx] >> idx_of_bit_in_3bit_group) & 1
-
-                    # Place the bit in the correct position in the current output sample array
-                    s_arrays[s_idx] |= (source_bit_val_array << bit_pos_in_s)
-        
-        # Stack S0, S1, S2, S3 arrays side-by-side (columns) and then flatten row-wise
-        unswizzled_output = np.stack(s_arrays, axis=1).flatten()
-
-        return unswizzled_output
+        # The bit scatter above is precomputed per word lane in _RDIF_LUT,
+        # with each table entry carrying that word's contribution to all four
+        # samples packed in one uint64. A whole block therefore unswizzles as
+        # four gathers OR-ed together — one 64-bit store per block instead of
+        # four 16-bit column stores — and the packed result reinterprets
+        # directly as the flat S0 S1 S2 S3 sample stream.
+        packed = _RDIF_LUT[0][data_reshaped[:, 0]]
+        packed |= _RDIF_LUT[1][data_reshaped[:, 1]]
+        packed |= _RDIF_LUT[2][data_reshaped[:, 2]]
+        packed |= _RDIF_LUT[3][data_reshaped[:, 3]]
+        return packed.view(np.uint16)
     
     
 
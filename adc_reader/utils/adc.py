@@ -41,9 +41,11 @@
 #       get deleted to it
 # ------------------------------------------------------------------------------
 
-import codecs
+import os
 import socket
-import struct
+import sys
+import threading
+from collections import deque
 from enum import Enum
 
 import numpy as np
@@ -70,7 +72,7 @@ class CMD(Enum):
         return str(self.value)
 
 
-# MESSAGE = codecs.decode(b'5aa509000000aaee', 'hex')
+# MESSAGE = bytes.fromhex('5aa509000000aaee')
 CONFIG_HEADER = '5aa5'
 CONFIG_STATUS = '0000'
 CONFIG_FOOTER = 'aaee'
@@ -79,6 +81,18 @@ CONFIG_FOOTER = 'aaee'
 MAX_PACKET_SIZE = 4096
 BYTES_IN_PACKET = 1456
 
+# Linux socket options for capture diagnostics; not exposed by the socket
+# module on every Python version, so fall back to the numeric values
+SO_RXQ_OVFL = getattr(socket, 'SO_RXQ_OVFL', 40)
+SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+
+# Precomputed wire messages for the zero-body command forms; commands with a
+# body (e.g. the configure() messages) are still built on demand
+_CMD_BYTES = {
+    cmd: bytes.fromhex(''.join((CONFIG_HEADER, str(cmd), '0000', CONFIG_FOOTER)))
+    for cmd in CMD
+}
+
 class DCA1000:
     """Software interface to the DCA1000 EVM board via ethernet.
 
@@ -112,7 +126,8 @@ class DCA1000:
                  num_bytes_per_sample: int = 2,
                  cmplx_valued: bool = False,
                  static_ip='192.168.33.30', adc_ip='192.168.33.180',
-                 data_port=4098, config_port=4096):
+                 data_port=4098, config_port=4096,
+                 rcvbuf_bytes: int = 16 * 1024 * 1024):
         # Save network data
         # self.static_ip = static_ip
         # self.adc_ip = adc_ip
@@ -142,30 +157,94 @@ class DCA1000:
         # Bind data socket to fpga
         self.data_socket.bind(self.data_recv)
 
-        # Modified by Leon Braungardt on 2025-05-10: Increase default socket buffer
-        self.data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 512 * 1024)
+        # Request a large kernel receive buffer: at the DCA1000's data rate a
+        # small buffer fills within milliseconds if the reader is descheduled,
+        # which shows up as dropped frames
+        self.data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf_bytes)
+        actual_rcvbuf = self.data_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if actual_rcvbuf < rcvbuf_bytes:
+            print(f"WARNING: OS capped data socket receive buffer at {actual_rcvbuf} bytes "
+                  f"(requested {rcvbuf_bytes}). On Linux, raise it via "
+                  f"'sysctl -w net.core.rmem_max={rcvbuf_bytes}'.")
+
+        # Kernel-side capture diagnostics (Linux only): kernel_drops is the
+        # cumulative count of packets the kernel dropped on this socket,
+        # last_pkt_ts the kernel receive timestamp of the last sampled packet.
+        # These distinguish real packet loss from late arrival when frames
+        # come up incomplete.
+        self.kernel_drops = 0
+        self.last_pkt_ts = None
+        self._diag_enabled = False
+        if sys.platform.startswith('linux'):
+            try:
+                self.data_socket.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+                self.data_socket.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+                self._diag_enabled = True
+            except OSError:
+                pass
 
         # Bind config socket to fpga
         self.config_socket.bind(self.cfg_recv)
 
-        self.data = []
-        self.packet_count = []
-        self.byte_count = []
-
-        self.frame_buff = {}
-
-        self.curr_buff = None
-        self.last_frame = None
-
-        self.lost_packets = None
-
-    def configure(self):
+        # Preallocated structure-of-arrays ring buffer for partially received
+        # frames (avoids allocating fresh dicts/arrays per frame on the hot
+        # UDP receive path). Slot for a frame is frame_id % num_frame_slots.
+        # A slot with frame_id -1 is free.
+        self.num_frame_slots = 4
+        self._ring_data = [np.empty(self.uint16_in_frame, dtype=np.uint16)
+                           for _ in range(self.num_frame_slots)]
+        self._ring_received = np.zeros(self.num_frame_slots, dtype=np.int64)
+        self._ring_frame_id = np.full(self.num_frame_slots, -1, dtype=np.int64)
+        self._ring_first_seen = np.zeros(self.num_frame_slots)
+        self._last_gc_time = 0.0
+
+        # Free list of recycled frame buffers; completed frames are handed out
+        # without a copy and their slot is refilled from here (see release_frame())
+        self._free_bufs = []
+
+        # Preallocated receive buffer so reading a UDP packet does not
+        # allocate a fresh bytes object per packet
+        self._pkt_buf = bytearray(MAX_PACKET_SIZE)
+        self._pkt_mv = memoryview(self._pkt_buf)
+
+        # Dedicated capture thread state: packets are received into a
+        # preallocated single-producer/single-consumer ring of buffers so the
+        # tight recv loop never waits on frame assembly. Head is only written
+        # by the capture thread, tail only by the consumer (read()).
+        self._rx_ring_size = 2048
+        self._rx_ring = np.empty((self._rx_ring_size, MAX_PACKET_SIZE), dtype=np.uint8)
+        self._rx_views = [memoryview(self._rx_ring[i]) for i in range(self._rx_ring_size)]
+        self._rx_lens = [0] * self._rx_ring_size
+        # Parsed (slot, packet_num, byte_count) headers of pending ring slots;
+        # filled in one vectorized pass when several packets are waiting
+        self._hdr_cache = deque()
+        self._rx_head = 0
+        self._rx_tail = 0
+        self._rx_slot_pending = False
+        self._rx_overflows = 0
+        self._rx_running = False
+        self._rx_thread = None
+        # Per-byte shifts for little-endian header fields (4-byte packet
+        # number, 6-byte byte count) used by the batched header parse
+        self._hdr_shifts = 8 * np.arange(6, dtype=np.int64)
+
+    def configure(self, packet_size: int = 1472, packet_delay_us: int = 25):
         """Initializes and connects to the FPGA
 
+        Args:
+            packet_size (int): UDP payload size in bytes the FPGA should use.
+                               The DCA1000 only supports 48..1472 (no jumbo
+                               frames), so 1472 is already the per-packet
+                               maximum; smaller values only make sense for
+                               debugging lossy links.
+            packet_delay_us (int): Delay between packets in microseconds
+
         Returns:
             None
 
         """
+        if not 48 <= packet_size <= 1472:
+            raise ValueError("DCA1000 supports UDP payload sizes of 48 to 1472 bytes only")
         # SYSTEM_CONNECT_CMD_CODE
         # 5a a5 09 00 00 00 aa ee
         # print(self._send_command(CMD.SYSTEM_CONNECT_CMD_CODE))
@@ -191,10 +270,13 @@ class DCA1000:
         # CONFIG_PACKET_DATA_CMD_CODE
         # set UDP params (CONFIG_PACKET_DATA_CMD_CODE), seems to be LE
         # source: https://e2e.ti.com/support/sensors-group/sensors/f/sensors-forum/702269/dca1000evm-expected-packet-loss-rate
-        #   0x05c0: Packet Size (UDP payload):  1472
-        #   0x0c35: Packet Delay:               3125 (API value for 25us)
-        # 5a a5 0b 00 06 00 c0 05 35 0c 00 00 aa ee
-        self._send_command(CMD.CONFIG_PACKET_DATA_CMD_CODE, '0600', 'c005350c0000')
+        #   packet size (UDP payload) LE, e.g. 0x05c0 = 1472
+        #   packet delay API value LE, 125 per us, e.g. 0x0c35 = 3125 for 25us
+        # defaults: 5a a5 0b 00 06 00 c0 05 35 0c 00 00 aa ee
+        body = (packet_size.to_bytes(2, 'little').hex()
+                + (packet_delay_us * 125).to_bytes(2, 'little').hex()
+                + '0000')
+        self._send_command(CMD.CONFIG_PACKET_DATA_CMD_CODE, '0600', body)
     
     def reset(self):
         """Resets the FPGA
@@ -214,6 +296,8 @@ class DCA1000:
         Returns:
             None
         """
+        # Start the capture thread first so no packet of the first frame is missed
+        self._start_rx_thread()
         # RECORD_START_CMD_CODE
         # Page 47 in ti/mmwave_studio_04_01_00_06/mmWaveStudio/ReferenceCode/DCA1000/Docs/
         #       TI_DCA1000EVM_CLI_Software_DeveloperGuide.pdf
@@ -230,7 +314,9 @@ class DCA1000:
         # Page 53 in ti/mmwave_studio_04_01_00_06/mmWaveStudio/ReferenceCode/DCA1000/Docs/
         #       TI_DCA1000EVM_CLI_Software_DeveloperGuide.pdf
         # 5a a5 06 00 00 00 aa ee
-        return self._send_command(CMD.RECORD_STOP_CMD_CODE)
+        resp = self._send_command(CMD.RECORD_STOP_CMD_CODE)
+        self._stop_rx_thread()
+        return resp
 
     def close(self):
         """Closes the sockets that are used for receiving and sending data
@@ -239,6 +325,7 @@ class DCA1000:
             None
 
         """
+        self._stop_rx_thread()
         self.data_socket.close()
         self.config_socket.close()
 
@@ -258,22 +345,31 @@ class DCA1000:
         timeout_incomplete_frames = self.frame_period_seconds * 2
 
         # Read packets until a full frame is read
-        while True: 
+        while True:
             # Read UDP packet
             packet_num, byte_count, packet_data = self._read_data_packet()
 
+            # Take the timestamp once per packet and reuse it below
+            now = time.time()
+
             # Place data from UDP packet in frame buffer
             frame_num, frame_data = self._place_data_packet_in_frame_buffer(
-                byte_count=byte_count, 
-                payload=packet_data
+                byte_count=byte_count,
+                payload=packet_data,
+                now=now
             )
 
             if frame_data is not None:
-                # Remove incomplete frames from frame buffer which exceed a timeout
-                dropped_frames = self._delete_incomplete_frames(timeout_seconds=timeout_incomplete_frames)
-                if dropped_frames:
-                    ids = ", ".join(str(f) for f in dropped_frames)
-                    print(f"WARNING: Dropped Frame(s) {ids} since they weren't complete.")
+                # Remove incomplete frames from frame buffer which exceed a
+                # timeout; scanning at most once per frame period is enough
+                # since the timeout itself is a multiple of the frame period
+                if now - self._last_gc_time > self.frame_period_seconds:
+                    self._last_gc_time = now
+                    dropped_frames = self._delete_incomplete_frames(
+                        timeout_seconds=timeout_incomplete_frames, now=now)
+                    if dropped_frames:
+                        ids = ", ".join(str(f) for f in dropped_frames)
+                        print(f"WARNING: Dropped Frame(s) {ids} since they weren't complete.")
                 # Return the complete frame
                 return frame_data
 
@@ -294,9 +390,12 @@ class DCA1000:
         # Create timeout exception
         self.config_socket.settimeout(timeout)
 
-        # Create and send message
+        # Create and send message (zero-body messages are precomputed)
         resp = ''
-        msg = codecs.decode(''.join((CONFIG_HEADER, str(cmd), length, body, CONFIG_FOOTER)), 'hex')
+        if length == '0000' and not body:
+            msg = _CMD_BYTES[cmd]
+        else:
+            msg = bytes.fromhex(''.join((CONFIG_HEADER, str(cmd), length, body, CONFIG_FOOTER)))
         try:
             self.config_socket.sendto(msg, self.cfg_dest)
             resp, addr = self.config_socket.recvfrom(MAX_PACKET_SIZE)
@@ -304,6 +403,93 @@ class DCA1000:
             print(e)
         return resp
 
+    def _start_rx_thread(self):
+        """Starts the dedicated UDP capture thread (no-op if already running)
+
+        Returns:
+            None
+        """
+        if self._rx_thread is not None and self._rx_thread.is_alive():
+            return
+        self._rx_running = True
+        self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True,
+                                           name='DCA1000-rx')
+        self._rx_thread.start()
+
+    def _stop_rx_thread(self):
+        """Stops the dedicated UDP capture thread if it is running
+
+        Returns:
+            None
+        """
+        self._rx_running = False
+        if self._rx_thread is not None:
+            # Wake the capture thread out of its blocking receive immediately
+            # with a zero-byte datagram to our own port, instead of letting it
+            # idle out the socket timeout. The runt-packet guard in _rx_loop
+            # keeps the wakeup datagram out of the packet ring.
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as wake:
+                    wake.sendto(b'', self.data_socket.getsockname())
+            except OSError:
+                pass
+            self._rx_thread.join(timeout=1.0)
+            self._rx_thread = None
+
+    def _rx_loop(self):
+        """Tight receive loop running on the capture thread
+
+        Does nothing but receive packets into the preallocated ring and bump
+        the head index, so frame assembly in read() can fall behind up to the
+        ring depth without the kernel buffer overflowing.
+        """
+        self.data_socket.settimeout(0.5)
+        # Best effort: ask for real-time scheduling for this thread so a
+        # loaded system cannot preempt it mid packet burst (the DCA1000 has
+        # a small FIFO and drops on the wire are unrecoverable). Requires
+        # CAP_SYS_NICE on Linux and does not exist on Windows; silently
+        # stays at default scheduling in either case.
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        except (AttributeError, PermissionError, OSError):
+            pass
+        # Bind everything the loop touches to locals once; the loop body then
+        # runs without any attribute lookups on self
+        recvmsg_into = self.data_socket.recvmsg_into
+        rx_views = self._rx_views
+        rx_lens = self._rx_lens
+        ring_size = self._rx_ring_size
+        scratch = [self._pkt_mv]
+        sock_timeout = socket.timeout
+        ancbuf = 64 if self._diag_enabled else 0
+        while self._rx_running:
+            if self._rx_head - self._rx_tail >= ring_size:
+                # Ring is full (consumer fell a whole ring behind); receive
+                # into the scratch buffer and drop the packet
+                try:
+                    recvmsg_into(scratch)
+                except sock_timeout:
+                    continue
+                self._rx_overflows += 1
+                continue
+            slot = self._rx_head % ring_size
+            try:
+                nbytes, ancdata, msg_flags, addr = recvmsg_into([rx_views[slot]], ancbuf)
+            except sock_timeout:
+                continue
+            except OSError:
+                break # Socket was closed
+            if nbytes < 10:
+                # Runt datagram: shorter than the 10-byte DCA1000 header, so
+                # it cannot be a data packet (e.g. the shutdown wakeup)
+                continue
+            rx_lens[slot] = nbytes
+            self._rx_head += 1
+            # The drop counter is cumulative, so sampling the ancillary data
+            # every 256th packet is enough and keeps the loop tight
+            if ancdata and (self._rx_head & 0xFF) == 0:
+                self._parse_diag_ancdata(ancdata)
+
     def _read_data_packet(self):
         """Helper function to read in a single ADC packet via UDP
 
@@ -311,19 +497,116 @@ class DCA1000:
             int: Current packet number, byte count of data that has already been read, raw ADC data in current packet
 
         """
-        data, addr = self.data_socket.recvfrom(MAX_PACKET_SIZE)
-        packet_num = struct.unpack('<1l', data[:4])[0]
-        byte_count = struct.unpack('>Q', b'\x00\x00' + data[4:10][::-1])[0]
-        packet_data = np.frombuffer(data[10:], dtype=np.uint16)
+        if self._rx_running or self._rx_head != self._rx_tail:
+            return self._next_packet_from_ring()
+        # Fallback (capture thread not running): receive directly into the
+        # preallocated buffer (no per-packet bytes allocation)
+        nbytes, ancdata, msg_flags, addr = self.data_socket.recvmsg_into(
+            [self._pkt_mv], 64 if self._diag_enabled else 0)
+        if ancdata:
+            self._parse_diag_ancdata(ancdata)
+        return self._parse_packet(self._pkt_mv, nbytes)
+
+    def _next_packet_from_ring(self):
+        """Helper function to take the next packet from the capture ring
+
+        Blocks until a packet is available; honors the timeout configured on
+        the data socket (raises socket.timeout like a direct receive would).
+
+        Returns:
+            int: Current packet number, byte count of data that has already been read, raw ADC data in current packet
+        """
+        # Release the slot handed out by the previous call; the payload view
+        # into it has been consumed by now
+        if self._rx_slot_pending:
+            self._rx_tail += 1
+            self._rx_slot_pending = False
+
+        if not self._hdr_cache:
+            timeout = self.data_socket.gettimeout()
+            deadline = None if timeout is None else time.time() + timeout
+            while self._rx_tail == self._rx_head:
+                if not self._rx_running:
+                    raise socket.timeout('DCA1000 capture thread is not running')
+                if deadline is not None and time.time() > deadline:
+                    raise socket.timeout('timed out waiting for ADC data packet')
+                time.sleep(0.0002)
+
+            avail = min(self._rx_head - self._rx_tail, 64)
+            if avail > 1:
+                # Parse the headers of all pending packets in one vectorized
+                # pass instead of byte-fiddling each one individually
+                rows = (self._rx_tail + np.arange(avail)) % self._rx_ring_size
+                hdr = self._rx_ring[rows, :10].astype(np.int64)
+                packet_nums = (hdr[:, :4] << self._hdr_shifts[:4]).sum(axis=1).astype(np.int32)
+                byte_counts = (hdr[:, 4:10] << self._hdr_shifts[:6]).sum(axis=1)
+                for i in range(avail):
+                    self._hdr_cache.append((int(rows[i]), int(packet_nums[i]), int(byte_counts[i])))
+            else:
+                slot = self._rx_tail % self._rx_ring_size
+                self._rx_slot_pending = True
+                return self._parse_packet(self._rx_views[slot], self._rx_lens[slot])
+
+        slot, packet_num, byte_count = self._hdr_cache.popleft()
+        nbytes = self._rx_lens[slot]
+        packet_data = np.frombuffer(self._rx_views[slot][10:nbytes], dtype=np.uint16)
+        self._rx_slot_pending = True
+        return packet_num, byte_count, packet_data
+
+    def _parse_diag_ancdata(self, ancdata):
+        """Helper function to parse kernel diagnostics from recvmsg ancillary data
+
+        Updates self.kernel_drops (cumulative kernel-side packet drops from
+        SO_RXQ_OVFL) and self.last_pkt_ts (kernel receive timestamp from
+        SO_TIMESTAMPNS).
+
+        Args:
+            ancdata (list): Ancillary data list as returned by recvmsg_into
+
+        Returns:
+            None
+        """
+        for level, ctype, cdata in ancdata:
+            if level != socket.SOL_SOCKET:
+                continue
+            if ctype == SO_RXQ_OVFL:
+                self.kernel_drops = int.from_bytes(cdata[:4], 'little')
+            elif ctype == SO_TIMESTAMPNS and len(cdata) >= 16:
+                sec = int.from_bytes(cdata[:8], 'little', signed=True)
+                nsec = int.from_bytes(cdata[8:16], 'little', signed=True)
+                self.last_pkt_ts = sec + nsec * 1e-9
+
+    @staticmethod
+    def _parse_packet(buf: memoryview, nbytes: int):
+        """Helper function to parse one received UDP packet
+
+        Args:
+            buf (memoryview): Buffer holding the raw packet
+            nbytes (int): Number of valid bytes in the buffer
+
+        Returns:
+            int: Current packet number, byte count of data that has already been read, raw ADC data in current packet
+        """
+        # Both header fields are little-endian: a 4-byte sequence number and a
+        # 6-byte cumulative byte count
+        packet_num = int.from_bytes(buf[:4], 'little', signed=True)
+        byte_count = int.from_bytes(buf[4:10], 'little')
+        # Zero-copy view into the receive buffer; safe because
+        # _place_data_packet_in_frame_buffer copies via slice-assign before
+        # the buffer is reused
+        packet_data = np.frombuffer(buf[10:nbytes], dtype=np.uint16)
         return packet_num, byte_count, packet_data
     
-    def _place_data_packet_in_frame_buffer(self, byte_count: int, payload: np.ndarray):
+    def _place_data_packet_in_frame_buffer(self, byte_count: int, payload: np.ndarray,
+                                           now: float = None):
         """Helper function to place one UDP packet at the correct position in the frame buffer
-        
+
         Args:
             byte_count (int):        cumulative Bytes before this payload (from DCA1000 header)
             payload (np.ndarray):    uint16 from the UDP packet
-        
+            now (float):             current timestamp (avoids a time.time() call if the
+                                     caller already took one)
+
         Returns:
             (int, np.ndarray): Complete frame as a tuple of (frame_num, frame_data),
                                 (None, None) if no frame is complete yet
@@ -334,12 +617,23 @@ class DCA1000:
         remaining = payload.size # Number of uint16 to process
         completed = (None, None) # Tuple of (frame_id, frame_data) for complete captured frame
 
+        if now is None:
+            now = time.time()
+
+        # Hoist attribute lookups out of the per-packet loop
+        uint16_in_frame = self.uint16_in_frame
+        num_frame_slots = self.num_frame_slots
+        ring_data       = self._ring_data
+        ring_received   = self._ring_received
+        ring_frame_id   = self._ring_frame_id
+        ring_first_seen = self._ring_first_seen
+
         while remaining > 0:
             # Determine which frame_id this data chunk belongs to
-            frame_id = offset // self.uint16_in_frame
+            frame_id = offset // uint16_in_frame
             # Determine which packet number this is within the frame
-            packet_num_within_frame = offset % self.uint16_in_frame
-            n_uint16_to_frame_end = self.uint16_in_frame - packet_num_within_frame
+            packet_num_within_frame = offset % uint16_in_frame
+            n_uint16_to_frame_end = uint16_in_frame - packet_num_within_frame
 
             # Determine the size chunk of the data which is written to buffer
             # (detect if the frame border is within this packet or not)
@@ -347,52 +641,78 @@ class DCA1000:
 
             # print(f"pkt start off={offset}, take={chunk_size}, frame={frame_id}")
 
-            # Create buffer within frame_buff obj for this frame if neccessary
-            buf = self.frame_buff.setdefault(
-                frame_id,
-                {
-                    'data':   np.empty(self.uint16_in_frame, dtype=np.uint16),
-                    'filled': np.zeros(self.uint16_in_frame, dtype=bool),
-                    'first_seen': time.time()
-                }
-            )
+            # Claim the ring slot for this frame if it does not hold it yet
+            # (a stale incomplete frame occupying the slot is overwritten)
+            slot = frame_id % num_frame_slots
+            if ring_frame_id[slot] != frame_id:
+                ring_frame_id[slot] = frame_id
+                ring_received[slot] = 0
+                ring_first_seen[slot] = now
 
-            # Write chunk to appropriate position in the frame's buffer
+            # Write chunk to appropriate position in the frame's slot
             start   = packet_num_within_frame
             end     = packet_num_within_frame + chunk_size
-            buf['data'][start:end]   = payload[idx:idx+chunk_size]
-            buf['filled'][start:end] = True
+            ring_data[slot][start:end] = payload[idx:idx+chunk_size]
+            # The DCA1000 sends packets in strict byte_count order and chunks
+            # are contiguous, so a running count of received uint16 suffices
+            # to detect completion (no boolean mask / .all() scan needed)
+            ring_received[slot] += chunk_size
 
             # If all packets for the frame have been read, add it to completed tuple
             # (but do not return yet, as otherwise the rest of the packet data is lost)
-            if buf['filled'].all():
-                completed = (frame_id, buf['data'].copy())
-                del self.frame_buff[frame_id]
+            if ring_received[slot] == uint16_in_frame:
+                # Hand the slot's buffer out without copying and refill the
+                # slot from the free list (or a fresh allocation if empty)
+                completed = (frame_id, ring_data[slot])
+                if self._free_bufs:
+                    ring_data[slot] = self._free_bufs.pop()
+                else:
+                    ring_data[slot] = np.empty(uint16_in_frame, dtype=np.uint16)
+                ring_frame_id[slot] = -1
 
             # Persist in helper vars that chunk has been read
             offset    += chunk_size
             idx       += chunk_size
             remaining -= chunk_size
-        
+
         return completed
 
-    def _delete_incomplete_frames(self, timeout_seconds: float=0.2):
+    def release_frame(self, frame_data: np.ndarray):
+        """Returns a frame buffer obtained from read() to the internal free list
+
+        Calling this once the frame data has been consumed allows the buffer to
+        be reused for a future frame instead of allocating a new one.
+
+        Args:
+            frame_data (np.ndarray): Buffer previously returned by read()
+
+        Returns:
+            None
+        """
+        if frame_data is not None and frame_data.size == self.uint16_in_frame:
+            self._free_bufs.append(frame_data)
+
+    def _delete_incomplete_frames(self, timeout_seconds: float=0.2, now: float = None):
         """Helper function to delete incomplete frames from frame buffer which exceed a given timeout
 
         Args:
             timeout_seconds (float): Time after which incomplete frames are deleted
-        
+            now (float): current timestamp (avoids a time.time() call if the
+                         caller already took one)
+
         Returns:
             List[int]: List of frame numbers which were deleted (can be empty)
         """
-        now = time.time()
+        if now is None:
+            now = time.time()
         to_delete = []
-        for frame_number, buf in self.frame_buff.items():
-            if now - buf['first_seen'] > timeout_seconds:
-                to_delete.append(frame_number)
-        for frame_number in to_delete:
-            del self.frame_buff[frame_number]
-        
+        for slot in range(self.num_frame_slots):
+            if self._ring_frame_id[slot] == -1:
+                continue
+            if now - self._ring_first_seen[slot] > timeout_seconds:
+                to_delete.append(int(self._ring_frame_id[slot]))
+                self._ring_frame_id[slot] = -1
+
         return to_delete
 
     def _listen_for_error(self):
@@ -418,12 +738,18 @@ class DCA1000:
             num_samples: Number of ADC samples included in each chirp
 
         Returns:
-            ndarray: Reformatted frame of raw data of shape (num_chirps, num_rx, num_samples)
+            ndarray: Reformatted frame of raw data (complex64) of shape (num_chirps, num_rx, num_samples)
 
         """
-        ret = np.zeros(len(raw_frame) // 2, dtype=complex)
-
-        # Separate IQ data
-        ret[0::2] = raw_frame[0::4] + 1j * raw_frame[2::4]
-        ret[1::2] = raw_frame[1::4] + 1j * raw_frame[3::4]
+        # Separate IQ data: the stream is interleaved as [I0, I1, Q0, Q1, ...],
+        # so after reshaping to rows of 4 the first two columns are the real
+        # parts and the last two the imaginary parts of two samples. Writing
+        # through .real/.imag avoids the strided complex temporaries that
+        # per-stride assignments with 1j would create.
+        # complex64 is plenty for 12-bit ADC data and halves the memory
+        # traffic of this frame and everything downstream of it
+        pairs = raw_frame.reshape(-1, 4)
+        ret = np.empty((pairs.shape[0], 2), dtype=np.complex64)
+        ret.real = pairs[:, 0:2]
+        ret.imag = pairs[:, 2:4]
         return ret.reshape((num_chirps, num_rx, num_samples))
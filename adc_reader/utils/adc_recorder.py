@@ -1,3 +1,4 @@
+import os
 import time
 import threading
 from queue import Queue
@@ -14,13 +15,25 @@ class ADCRecorder(threading.Thread):
     It consumes frames from the queue, stores them, and stops once the 
     target number of frames is reached or when explicitly stopped.
     """
-    def __init__(self, input_queue: Queue, num_frames: int):
+    def __init__(self, input_queue: Queue, num_frames: int, release=None,
+                 mmap_path: str | Path = None):
         """
         Initializes the ADCRecorder.
 
         Args:
-            input_queue: The queue from which frames are read. 
+            input_queue: The queue from which frames are read.
             num_frames (int): The total number of frames to record.
+            release (callable, optional): Called with each frame after it has
+                                          been copied into the recording
+                                          buffer, e.g. AdcReader.release to
+                                          recycle the frame slab.
+            mmap_path (str | Path, optional): If given, the recording buffer
+                                              is memory-mapped to this file
+                                              instead of held in RAM. Long
+                                              captures are then bounded by
+                                              disk, not memory: writes go to
+                                              the page cache and the OS
+                                              flushes them asynchronously.
 
         Raises:
             ValueError: If num_frames is negative.
@@ -32,8 +45,12 @@ class ADCRecorder(threading.Thread):
 
         self.input_queue = input_queue
         self.num_frames_to_record = num_frames
-        
-        self.recorded_frames = []
+        self._release = release
+        self._mmap_path = mmap_path
+
+        # Preallocated (num_frames, *frame_shape) recording buffer; allocated
+        # lazily from the first frame since the frame shape is only known at runtime
+        self._frames = None
         self._frames_recorded_count = 0
         self._running = False
         
@@ -46,15 +63,28 @@ class ADCRecorder(threading.Thread):
         of frames is recorded or the recording is stopped via the _running flag.
         """
         try:
-            pbar = tqdm(total=1024, desc="Collecting frames", unit="frames",ncols=120)
+            pbar = tqdm(total=self.num_frames_to_record, desc="Collecting frames",
+                        unit="frames", ncols=120, mininterval=0.2)
             while self._running and self._frames_recorded_count < self.num_frames_to_record:
                 try:
-                    # Read frame from input_queue with a timeout of 1s and add to recorded_frames[]
+                    # Read frame from input_queue with a timeout of 5s and store it
                     frame = self.input_queue.get(timeout=5.0)
-                    self.recorded_frames.append(frame)
+                    if self._frames is None:
+                        shape = (self.num_frames_to_record,) + frame.shape
+                        if self._mmap_path is not None:
+                            # On-disk buffer: the frame store is a file-backed
+                            # mapping, so frame writes below are plain slice
+                            # assignments into the page cache
+                            self._frames = np.memmap(self._mmap_path, dtype=frame.dtype,
+                                                     mode='w+', shape=shape)
+                        else:
+                            self._frames = np.empty(shape, dtype=frame.dtype)
+                    self._frames[self._frames_recorded_count] = frame
                     self._frames_recorded_count += 1
-                    pbar.n = self._frames_recorded_count
-                    pbar.refresh()
+                    if self._release is not None:
+                        self._release(frame)
+                    # tqdm rate-limits the actual redraw via mininterval
+                    pbar.update(1)
                 except QueueEmpty:
                     print("Timeout: Input Queue was empty for 5 seconds.")
                     raise
@@ -68,6 +98,10 @@ class ADCRecorder(threading.Thread):
             print(f"ADC Recorder: An error occurred during recording: {e}")
         finally:
             self._running = False
+            if isinstance(self._frames, np.memmap):
+                # Push any dirty pages of the on-disk buffer out before
+                # declaring the recording complete
+                self._frames.flush()
             # Set event that indicates that recording has completed
             self.recording_task_complete_event.set()
 
@@ -82,7 +116,7 @@ class ADCRecorder(threading.Thread):
             print("ADC Recorder: Cannot start. Recording thread is already active.")
             return False
         
-        self.recorded_frames = []
+        self._frames = None
         self._frames_recorded_count = 0
         self.recording_task_complete_event.clear()
         
@@ -117,32 +151,43 @@ class ADCRecorder(threading.Thread):
             else:
                 print("ADC Recorder: Recording thread joined successfully.")
 
-    def get_recorded_frames(self) -> list:
+    def get_recorded_frames(self) -> np.ndarray:
         """
-        Returns the list of frames that have been recorded.
+        Returns the frames that have been recorded so far.
 
         Returns:
-            list: A list containing the recorded frames.
+            np.ndarray: Array of shape (frames_recorded, *frame_shape), empty if none.
         """
         if self._running and not self.recording_task_complete_event.is_set():
             print("ADC Recorder: Warning - Requesting data while recording is actively in progress.")
-        return self.recorded_frames
+        if self._frames is None:
+            return np.empty(0)
+        return self._frames[:self._frames_recorded_count]
 
-    def save_to_npz(self, file_path: str | Path, config_metadata: dict = None) -> bool:
+    def save_to_npz(self, file_path: str | Path, config_metadata: dict = None,
+                    compression: str = None) -> bool:
         """
         Saves the recorded ADC frames and optional configuration
-        metadata to a compressed NumPy .npz file.
+        metadata to a NumPy .npz file.
+
+        The file is written uncompressed by default: raw ADC data is noisy
+        and compresses poorly with DEFLATE, which made np.savez_compressed
+        block for seconds on large recordings.
 
         Args:
             file_path (str | Path): The path (including filename) where the .npz file will be saved.
             config_metadata (dict, optional): A dictionary containing metadata to be saved.
                                               Keys should be strings, values should be compatible
                                               with NumPy array conversion (e.g., numbers, strings, lists).
+            compression (str, optional): None (default, uncompressed), 'deflate'
+                                         (previous np.savez_compressed behavior) or 'zstd'
+                                         (compress the written file in a background thread;
+                                         requires the zstandard package).
 
         Returns:
             bool: True if saving was successful, False otherwise.
         """
-        if not self.recorded_frames:
+        if self._frames_recorded_count == 0:
             print("ADC Recorder: No frames recorded to save.")
             return False
         
@@ -152,8 +197,8 @@ class ADCRecorder(threading.Thread):
         try:
             file_path_str = str(file_path)
 
-            # Stack frames into a single dimensional array
-            frames_array = np.array(self.recorded_frames)
+            # Frames are already stored contiguously in the preallocated buffer
+            frames_array = self._frames[:self._frames_recorded_count]
 
             data_to_save = {
                 'adc_data': frames_array,
@@ -166,13 +211,41 @@ class ADCRecorder(threading.Thread):
                 # (allows retrieving it as a dictionary using .item())
                 data_to_save['config_metadata'] = np.array(config_metadata, dtype=object)
             
-            np.savez_compressed(file_path_str, **data_to_save)
+            if compression == 'deflate':
+                np.savez_compressed(file_path_str, **data_to_save)
+            else:
+                np.savez(file_path_str, **data_to_save)
+                if compression == 'zstd':
+                    npz_path = file_path_str if file_path_str.endswith('.npz') else file_path_str + '.npz'
+                    threading.Thread(target=self._compress_with_zstd, args=(npz_path,),
+                                     daemon=True).start()
             print(f"ADC Recorder: Successfully saved {self._frames_recorded_count} frames and associated data to {file_path_str}")
             return True
         except Exception as e:
             print(f"ADC Recorder: Error saving data to NPZ file '{file_path}': {e}")
             return False
 
+    @staticmethod
+    def _compress_with_zstd(npz_path: str):
+        """
+        Compresses a written .npz file to <file>.npz.zst in the background and
+        removes the original. Leaves the uncompressed file in place if the
+        zstandard package is missing or compression fails.
+        """
+        try:
+            import zstandard
+        except ImportError:
+            print("ADC Recorder: zstandard package not installed, leaving file uncompressed.")
+            return
+        try:
+            cctx = zstandard.ZstdCompressor(level=1, threads=-1)
+            with open(npz_path, 'rb') as src, open(npz_path + '.zst', 'wb') as dst:
+                cctx.copy_stream(src, dst)
+            os.remove(npz_path)
+            print(f"ADC Recorder: Compressed recording to {npz_path}.zst")
+        except Exception as e:
+            print(f"ADC Recorder: zstd compression failed ({e}), keeping uncompressed file.")
+
     def get_frames_recorded_count(self) -> int:
         """
         Returns the number of frames that have been successfully recorded.
@@ -0,0 +1,86 @@
+import collections
+import time
+from queue import Empty
+
+
+class FrameBuffer:
+    """
+    A bounded single-producer/single-consumer frame buffer.
+
+    deque.append and deque.popleft are atomic in CPython, so handing a
+    frame from the reader thread to a single consumer does not take the
+    per-item mutex + condition-variable round trip of queue.Queue.
+
+    The interface mirrors the queue.Queue subset used in this package
+    (put, and get with a timeout raising queue.Empty), so it is a
+    drop-in replacement between AdcReader and ADCRecorder.
+
+    When the buffer is full, the oldest frame is dropped in favor of the
+    newest one: a stalled consumer produces a bounded gap in the stream
+    instead of unbounded memory growth.
+    """
+
+    # Consumer-side poll interval while waiting for a frame. Well below
+    # typical radar frame periods, so the added latency is negligible.
+    _POLL_INTERVAL_S = 0.001
+
+    def __init__(self, maxlen: int = 512):
+        """
+        Initializes the FrameBuffer.
+
+        Args:
+            maxlen (int): Maximum number of frames held before the
+                          oldest frame is dropped on put.
+        """
+        self._buf = collections.deque(maxlen=maxlen)
+
+    def put(self, item):
+        """Appends a frame, dropping the oldest one if the buffer is full."""
+        self._buf.append(item)
+
+    # put never blocks, so the non-blocking variant is the same call
+    put_nowait = put
+
+    def get(self, timeout: float = None):
+        """
+        Removes and returns the oldest frame.
+
+        Args:
+            timeout (float, optional): Maximum time in seconds to wait for
+                                       a frame. If None, waits indefinitely.
+
+        Returns:
+            The oldest buffered frame.
+
+        Raises:
+            queue.Empty: If no frame arrived within the timeout.
+        """
+        buf = self._buf
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return buf.popleft()
+            except IndexError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise Empty from None
+                time.sleep(self._POLL_INTERVAL_S)
+
+    def get_nowait(self):
+        """
+        Removes and returns the oldest frame without waiting.
+
+        Raises:
+            queue.Empty: If the buffer is empty.
+        """
+        try:
+            return self._buf.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def qsize(self) -> int:
+        """Returns the number of currently buffered frames."""
+        return len(self._buf)
+
+    def empty(self) -> bool:
+        """Returns True if no frames are currently buffered."""
+        return not self._buf
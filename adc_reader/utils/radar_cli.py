@@ -41,37 +41,32 @@ Typical Usage:
 """
 import serial
 from serial import SerialException
+from serial.threaded import ReaderThread, Packetizer
+import mmap
+import os
 import time
 from tqdm import tqdm
 import threading
 import queue
 
-class SerialMonitor(threading.Thread):
-    """Thread for monitoring serial port data in real-time."""
-    def __init__(self, serial_port, data_callback=None):
+class _LineProtocol(Packetizer):
+    """
+    pyserial line protocol that forwards each received raw bytes line to a
+    callback. Runs inside serial.threaded.ReaderThread, which uses blocking
+    reads (no polling) and supports prompt cancellation on close.
+    """
+    TERMINATOR = b'\n'
+
+    def __init__(self, data_callback=None):
         super().__init__()
-        self.serial_port = serial_port  # 使用传入的串口实例
-        self.running = True
-        self.daemon = True  # Make thread daemon so it exits when main program exits
         self.data_callback = data_callback  # 回调函数，用于通知接收到的数据
-        
-    def run(self):
-        try:
-            print(f"Started monitoring serial port")
-            while self.running:
-                if self.serial_port.in_waiting:
-                    data = self.serial_port.readline().decode('utf-8', errors='ignore').strip()
-                    if data:
-                        # print(f"Serial Data: {data}")
-                        # 如果设置了回调函数，则调用它
-                        if self.data_callback:
-                            self.data_callback(data)
-                time.sleep(0.01)
-        except Exception as e:
-            print(f"Serial monitor error: {e}")
-                
-    def stop(self):
-        self.running = False
+
+    def handle_packet(self, packet):
+        # The raw bytes are passed on as-is; matching and (rare) printing
+        # decide themselves whether a decode is needed.
+        data = packet.strip()
+        if data and self.data_callback:
+            self.data_callback(data)
 
 class RadarCLI():
     """
@@ -84,30 +79,138 @@ class RadarCLI():
         cli.send_stop_cmd()
         cli.close()
     """
-    def __init__(self, radar_serial_port):
+    def __init__(self, radar_serial_port, baudrate=921600, low_latency=True):
         """
         Initializes the RadarCLI.
 
         Args:
             radar_serial_port (str): The serial port for radar communication (e.g., "/dev/ttyACM1", "COM3").
+            baudrate (int): Serial baudrate. The EVM's UART supports 921600; on
+                            the XDS110 CDC-ACM port the setting is ignored and
+                            bytes move at USB speed regardless. If the CLI does
+                            not ack at the requested rate, the port falls back
+                            to 115200 automatically.
+            low_latency (bool): If True, tries to set the Linux serial driver's
+                                ASYNC_LOW_LATENCY flag on the port (no-op on
+                                Windows or if the driver does not support it).
         """
         try:
-            self.ser = serial.Serial(radar_serial_port, baudrate=115200, timeout=1)
+            self.ser = serial.Serial(radar_serial_port, baudrate=baudrate, timeout=1)
+            # One hardware flush at connect time clears boot/banner noise;
+            # per-command alignment is handled by the rx-queue drain, so no
+            # tcflush is issued on every send
+            self.ser.reset_input_buffer()
+            # On Windows, grow the driver's receive buffer from the 4 KiB
+            # default so a burst of CLI output (config echo + acks) cannot
+            # overrun it before the reader thread drains the port. The call
+            # only exists in pyserial's win32 backend; elsewhere the driver
+            # buffer is already ample.
+            try:
+                self.ser.set_buffer_size(rx_size=65536)
+            except (AttributeError, SerialException):
+                pass
+            if low_latency:
+                self._set_low_latency()
             self.last_received_data = None  # 存储最后接收到的数据
-            
-            # Start serial monitor thread using the same serial port instance
-            self.serial_monitor = SerialMonitor(self.ser, self.data_callback)
-            self.serial_monitor.start()
+            # Serializes whole send+wait cycles so two threads cannot
+            # interleave commands on the CLI; reentrant because close() sends
+            # the stop command while holding it
+            self._lock = threading.RLock()
+            # Queue of received lines; _send_and_listen blocks on it instead of
+            # polling. The queue's internal condition variable wakes waiters on
+            # put(), so no separate threading.Event is needed on the rx path.
+            # Bounded so unsolicited EVM output (banners, debug prints) cannot
+            # grow it without limit when nobody is waiting for acks.
+            self._rx_q = queue.Queue(maxsize=64)
+            # Parsed config lines memoized by (path, mtime) so reconnect/
+            # retry loops skip re-reading and re-tokenizing the file
+            self._cfg_cache = {}
+
+            # Start pyserial's reader thread on the port; it blocks in read
+            # and hands complete lines to data_callback via _LineProtocol
+            self._reader = ReaderThread(self.ser, lambda: _LineProtocol(self.data_callback))
+            self._reader.start()
+            self._reader.connect()  # Wait until the reader is actually running
+
+            # Probe the CLI at the requested rate; if it stays silent, assume a
+            # real-UART link that is still at the SDK default and drop back
+            if baudrate != 115200 and not self._send_and_listen("sensorStop 0", timeout=1):
+                print(f"No CLI response at {baudrate} baud, falling back to 115200")
+                self.ser.baudrate = 115200
         except Exception as e:
             print(f"Unable to open serial port {radar_serial_port}: {e}")
             raise
     
+    def _set_low_latency(self):
+        """
+        Sets the Linux serial driver's ASYNC_LOW_LATENCY flag so received bytes
+        are pushed to userspace immediately instead of being batched by the
+        driver (typically 16ms on FTDI/CDC adapters). Silently does nothing on
+        platforms or drivers where the ioctl is unavailable.
+        """
+        TIOCGSERIAL = 0x541E
+        TIOCSSERIAL = 0x541F
+        ASYNC_LOW_LATENCY = 0x2000
+        try:
+            import fcntl
+            import struct
+            # struct serial_struct: flags is the 4-byte field at offset 16
+            buf = bytearray(64)
+            fcntl.ioctl(self.ser.fd, TIOCGSERIAL, buf)
+            flags = struct.unpack_from('i', buf, 16)[0]
+            if not flags & ASYNC_LOW_LATENCY:
+                struct.pack_into('i', buf, 16, flags | ASYNC_LOW_LATENCY)
+                fcntl.ioctl(self.ser.fd, TIOCSSERIAL, buf)
+        except (ImportError, AttributeError, OSError):
+            pass
+
+    @staticmethod
+    def _match(raw: bytes):
+        """
+        Classifies a raw response line without decoding it.
+
+        Returns:
+            str | None: "done", "error", or None if the line is neither.
+        """
+        if b"Done" in raw:
+            return "done"
+        if b"Error" in raw:
+            return "error"
+        return None
+
     def data_callback(self, data):
-        """数据回调函数，用于更新最后接收到的数据"""
+        """数据回调函数，用于更新最后接收到的数据 (raw bytes line)"""
         self.last_received_data = data
+        try:
+            self._rx_q.put_nowait(data)
+        except queue.Full:
+            # Drop the oldest line; the monitor thread must never block
+            try:
+                self._rx_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._rx_q.put_nowait(data)
     def get_last_received_data(self):
         """获取最后接收到的数据"""
         return self.last_received_data
+
+    def _flush_rx(self):
+        """Discards any stale lines queued before the next command is sent."""
+        while True:
+            try:
+                self._rx_q.get_nowait()
+            except queue.Empty:
+                break
+
+    def flush_rx(self):
+        """
+        Explicitly discards all buffered radar output (queued lines and the
+        hardware input buffer). Useful for callers that interleave their own
+        traffic with this class on the same port.
+        """
+        self._flush_rx()
+        if self.ser and self.ser.is_open:
+            self.ser.reset_input_buffer()
     
     def _send_and_listen(self, command, timeout=2, encoding='utf-8') -> bool:
         """
@@ -129,68 +232,153 @@ class RadarCLI():
             raise SerialException("Serial port not open or available.")
 
         try:
-            # Clear the last received data before sending command
-            self.last_received_data = None
-            
-            # Send command
-            self.ser.write((command + '\n').encode(encoding))
-            time.sleep(0.2)
-
-            # Wait for response by checking last_received_data
-            end_time = time.time() + timeout
-            while time.time() < end_time:
-                if self.last_received_data:
-                    if "Done" in self.last_received_data:
-                        return True
-                    if "Error" in self.last_received_data:
-                        print(f"Error response: {self.last_received_data}")
-                        break
-                time.sleep(0.1)  # Check every 100ms
-            
-            # Done keyword not found within timeout
-            print(f"Could not get confirmation for command: {command}")
-            return False
+            with self._lock:
+                # Clear the last received data and any stale lines before sending command
+                self.last_received_data = None
+                self._flush_rx()
+
+                # Accept pre-encoded commands so callers can encode once up
+                # front; str commands are encoded here. Either form gets the
+                # newline terminator appended if it is missing.
+                if isinstance(command, (bytes, bytearray)):
+                    payload = bytes(command)
+                    if not payload.endswith(b'\n'):
+                        payload += b'\n'
+                else:
+                    payload = (command + '\n').encode(encoding)
+
+                # Send command; no fixed settle time needed, _wait_for_done blocks
+                # on the rx queue until the first response line arrives
+                self.ser.write(payload)
+
+                return self._wait_for_done(command, timeout)
         except SerialException as e:
             print(f"Serial communication error: {e}")
             return False
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
-    
-    def send_config(self, config_path):
+
+    def _wait_for_done(self, command, timeout=2) -> bool:
+        """
+        Blocks on the rx queue until "Done"/"Error" arrives or the timeout expires.
+
+        Args:
+            command (str): The command the ack belongs to (used for error reporting).
+            timeout (float): Total time in seconds to wait for the ack.
+
+        Returns:
+            bool: True if "Done" was received, False otherwise.
+        """
+        # Fast path: simple commands can be acked in under a millisecond, so
+        # the reply may already be queued — peek non-blocking before arming a
+        # timed wait and paying for the extra context switch
+        try:
+            while True:
+                data = self._rx_q.get_nowait()
+                match = self._match(data)
+                if match == "done":
+                    return True
+                if match == "error":
+                    print(f"Error response: {data.decode('utf-8', errors='ignore')}")
+                    print(f"Could not get confirmation for command: {command}")
+                    return False
+        except queue.Empty:
+            pass
+
+        # Monotonic clock: immune to wall-clock jumps (NTP, DST)
+        end_time = time.monotonic() + timeout
+        while True:
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                data = self._rx_q.get(timeout=remaining)
+            except queue.Empty:
+                break
+            match = self._match(data)
+            if match == "done":
+                return True
+            if match == "error":
+                # Only decode when the line actually gets printed
+                print(f"Error response: {data.decode('utf-8', errors='ignore')}")
+                break
+
+        # Done keyword not found within timeout
+        print(f"Could not get confirmation for command: {command}")
+        return False
+
+    def send_config(self, config_path, pipeline: bool = True):
         """
         Sends supplied .cfg file line by line to the radar mmWave CLI.
 
         Args:
             config_path (str): Path to the radar configuration file.
+            pipeline (bool): If True, writes all commands back-to-back and reaps
+                             the "Done" acks afterwards instead of waiting for
+                             each ack before sending the next line.
 
         Raises:
             FileNotFoundError: If the config file is not found.
-            Exception: If any command from the config file fails to send or be acknowledged.
+            RuntimeError: If a command is not acknowledged; the message names
+                          the failing line index, the command and the EVM's
+                          last response so callers can fix/retry that line.
         """
         print("Sending Config to radar EVM...")
-        
-        # Count lines in file
-        with open(config_path, 'r') as f:
-            total_lines = sum(1 for _ in f)
-            if total_lines == 0:
-                print("Config file is empty.")
-                return
-
-        with open(config_path, 'r') as file:
-            with tqdm(total=total_lines, unit='line', desc="Sending Cfg", leave=True) as pbar:
-                for i, line in enumerate(file):
-                    # Remove leading/trailing whitespace (includes \r, \n, spaces, tabs)
-                    line = line.strip()
-                    # Ignore comments and empty lines
-                    if not line or line.startswith('%'):
-                        pbar.update(1)
-                        continue
 
-                    # Write and check for success
-                    success = self._send_and_listen(line)
+        # Resending the same (unmodified) file skips straight to the cached
+        # command list; the mtime in the key invalidates edited files
+        cache_key = (str(config_path), os.path.getmtime(config_path))
+        cmds = self._cfg_cache.get(cache_key)
+        if cmds is None:
+            # Memory-map the file and scan it once as bytes: strips whitespace
+            # (includes \r, \n, spaces, tabs) and drops comments/empty lines
+            # without building per-line str objects
+            with open(config_path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    raw = b''
+                else:
+                    raw = bytes(mm)
+                    mm.close()
+            cmds = [ln for ln in (line.strip() for line in raw.split(b'\n'))
+                    if ln and not ln.startswith(b'%')]
+            self._cfg_cache[cache_key] = cmds
+        if not cmds:
+            print("Config file is empty.")
+            return
+
+        # Rate-limit the progress bar: redrawing stderr per line costs more
+        # than the serial write itself on a fast link, so refresh at most
+        # twice a second and in steps of ~5% of the file
+        with tqdm(total=len(cmds), unit='line', desc="Sending Cfg", leave=True,
+                  mininterval=0.5, miniters=max(1, len(cmds) // 20)) as pbar:
+            if pipeline:
+                with self._lock:
+                    # Drain stale lines once before the batch goes out
+                    self._flush_rx()
+                    # Submit the whole batch as a single write (one syscall
+                    # instead of one per line); the CLI UART consumes it at
+                    # line rate while the acks are reaped below
+                    self.ser.write(b'\n'.join(cmds) + b'\n')
+                    self.ser.flush()
+                    # Reap one ack per command, in order
+                    for i, cmd in enumerate(cmds):
+                        if not self._wait_for_done(cmd):
+                            raise RuntimeError(
+                                f"Radar rejected config line {i} ({cmd!r}): "
+                                f"{self.last_received_data!r}")
+                        pbar.update(1)
+            else:
+                for i, cmd in enumerate(cmds):
+                    # Write and check for success (commands are already bytes)
+                    success = self._send_and_listen(cmd + b'\n')
                     if not success:
-                        raise Exception("Failed to send config to radar")
+                        raise RuntimeError(
+                            f"Radar rejected config line {i} ({cmd!r}): "
+                            f"{self.last_received_data!r}")
                     pbar.update(1)
         print("Config sent successfully.")
 
@@ -204,13 +392,14 @@ class RadarCLI():
 
     def close(self):
         """Sends RF frontend stop command and closes the serial connection."""
-        # First stop the monitor thread
-        if hasattr(self, 'serial_monitor'):
-            self.serial_monitor.stop()
-            self.serial_monitor.join(timeout=1.0)  # Wait for thread to finish with timeout
-        
-        # Then close the main serial connection
-        if self.ser and self.ser.is_open:
-            self._send_and_listen("sensorStop 0")
-            self.ser.close()
+        with self._lock:
+            # Send the stop command while the reader is still delivering acks
+            if self.ser and self.ser.is_open:
+                self._send_and_listen("sensorStop 0")
+
+            # Stop the reader thread; ReaderThread.close() also closes the port
+            if hasattr(self, '_reader'):
+                self._reader.close()
+            elif self.ser and self.ser.is_open:
+                self.ser.close()
             self.ser = None
\ No newline at end of file
@@ -10,17 +10,19 @@
 # 导入系统和数学库
 import sys
 import numpy as np
-import queue
+from scipy import fft as sp_fft
+import collections
 from datetime import datetime
 from math import ceil
+from concurrent.futures import ThreadPoolExecutor
 # 导入PyQt5界面库
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, QProgressBar,
                              QComboBox, QDesktopWidget, QGridLayout, QSizePolicy, QGraphicsDropShadowEffect)
 # 导入Qt核心模块，用于定时器和常量
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, QElapsedTimer, Qt
 # 导入Qt字体和图形模块
-from PyQt5.QtGui import QFont, QLinearGradient, QColor, QPalette, QBrush, QPixmap
+from PyQt5.QtGui import QFont, QFontMetrics, QLinearGradient, QColor, QPalette, QBrush, QPixmap, QPainter
 # 导入pyqtgraph用于实时数据可视化
 import pyqtgraph as pg
 # 导入串口工具模块
@@ -37,6 +39,244 @@ from adc_reader import AdcReader  # ADC数据读取模块
 from examples.range_bin_analyzer import RangeBinAnalyzer  # 距离区间分析模块
 from examples.vital_signs_analyzer import VitalSignsAnalyzer  # 生命体征分析模块
 
+# BR/HR/时间环形缓冲区容量（约11小时，每10秒一个点）
+MAX_POINTS = 4096
+
+# 处理批大小：凑满1024帧做一次FFT，处理后逻辑保留最近824帧（滑动重叠）
+FRAME_BATCH = 1024
+FRAME_KEEP = 824
+
+# 预先构建曲线画笔/画刷（QColor解析只做一次，更新时直接复用）
+_BR_PEN = pg.mkPen('#1976d2', width=4)
+_BR_SYM_BRUSH = pg.mkBrush('#42a5f5')
+_BR_SYM_PEN = pg.mkPen('#1565c0', width=2)
+_HR_PEN = pg.mkPen('#f57c00', width=4)
+_HR_SYM_BRUSH = pg.mkBrush('#ff9800')
+_HR_SYM_PEN = pg.mkPen('#e65100', width=2)
+
+# 应用级QSS模板：按objectName选择，启动时format_map一次性插值全部像素尺寸，
+# 在应用级只解析/polish一次，避免构建期间十几次setStyleSheet触发的级联重新polish
+_APP_QSS = """
+    QWidget {{ outline: none; border: none; }}
+    QWidget:focus {{ outline: none; border: none; }}
+    #topBar {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #1976d2, stop:1 #2196f3);
+        border-radius: 8px;
+    }}
+    #titleLabel {{ color: white; font-size: 28px; font-weight: bold; background: transparent; }}
+    #portLabel {{ color: white; font-size: 14px; font-weight: bold; background: transparent; }}
+    #controlPanel, #brTitleRow, #brTextGroup, #hrTitleRow, #hrTextGroup {{ background: transparent; }}
+    #valuesPanel {{ background-color: transparent; }}
+    #portCombo {{
+        background-color: white;
+        border: 2px solid #1565c0;
+        border-radius: 8px;
+        padding: 5px 10px;
+        font-size: 12px;
+        font-weight: bold;
+        color: #1565c0;
+    }}
+    #portCombo::drop-down {{ border: none; width: 20px; }}
+    #portCombo::down-arrow {{
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #1565c0;
+    }}
+    #refreshButton {{
+        background-color: rgba(255, 255, 255, 0.9);
+        border: 2px solid white;
+        border-radius: 8px;
+        color: #1976d2;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    #refreshButton:hover {{ background-color: white; border-color: #42a5f5; }}
+    #refreshButton:pressed {{ background-color: #e3f2fd; }}
+    #clearLogsButton {{
+        background-color: #ffeb3b;
+        border: 2px solid #fbc02d;
+        border-radius: 8px;
+        color: #bf360c;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    #clearLogsButton:hover {{ background-color: #fffde7; border-color: #fbc02d; }}
+    #clearLogsButton:pressed {{ background-color: #ffe082; }}
+    #startButton {{
+        background-color: #4caf50;
+        border: 2px solid #4caf50;
+        border-radius: 8px;
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    #startButton:hover {{ background-color: #66bb6a; border-color: #66bb6a; }}
+    #startButton:pressed {{ background-color: #389e0d; }}
+    #logoContainer {{
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 6px;
+    }}
+    #contentCard, #progressCard {{
+        background-color: white;
+        border: 1px solid #e8e8e8;
+        border-radius: 8px;
+    }}
+    #brDecorator {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #1976d2, stop:1 #42a5f5);
+        border-radius: 2px;
+    }}
+    #brDistanceLabel {{ color: #1976d2; font-size: 14px; font-weight: bold; background: transparent; }}
+    #brIconContainer, #hrIconContainer {{
+        background: rgba(255,255,255,0.95);
+        border-radius: {icon_radius}px;
+    }}
+    #brIconLabel, #hrIconLabel {{ background: transparent; font-size: {icon_font}px; }}
+    #brChinese {{ color: #0d47a1; font-size: {title_font}px; font-weight: bold; background: transparent; }}
+    #brEnglish {{ color: #1976d2; font-size: {subtitle_font}px; font-weight: 500; background: transparent; }}
+    #brValueArea, #hrValueArea {{ background: rgba(255,255,255,0.95); border-radius: 15px; }}
+    #brValueLabel {{ color: #0d47a1; font-size: {value_font}px; font-weight: 900; background: transparent; }}
+    #brUnit {{ color: #1565c0; font-size: {unit_font}px; font-weight: bold; background: transparent; }}
+    #hrDecorator {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f57c00, stop:1 #ff9800);
+        border-radius: 2px;
+    }}
+    #hrChinese {{ color: #bf360c; font-size: {title_font}px; font-weight: bold; background: transparent; }}
+    #hrEnglish {{ color: #f57c00; font-size: {subtitle_font}px; font-weight: 500; background: transparent; }}
+    #hrValueLabel {{ color: #bf360c; font-size: {value_font}px; font-weight: 900; background: transparent; }}
+    #hrUnit {{ color: #e65100; font-size: {unit_font}px; font-weight: bold; background: transparent; }}
+    #progressBar {{
+        border: 1px solid #d9d9d9;
+        border-radius: 10px;
+        text-align: center;
+        font-size: 12px;
+        font-weight: bold;
+        color: #595959;
+        background-color: #f5f5f5;
+    }}
+    #progressBar::chunk {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                  stop:0 #1890ff, stop:1 #40a9ff);
+        border-radius: 9px;
+    }}
+"""
+
+class _FrameBuffer(collections.deque):
+    """
+    ADC线程到GUI的有界帧缓冲。
+    deque的append/popleft在CPython中是原子操作，每帧不再像queue.Queue
+    那样加锁；maxlen保证GUI卡顿时内存有界（丢最旧帧）。
+    put别名兼容AdcReader的队列接口。
+    """
+    def __init__(self, maxlen=512):
+        super().__init__(maxlen=maxlen)
+
+    put = collections.deque.append
+
+def _filter_outliers(values, threshold):
+    """
+    迭代剔除与均值偏差最大的点，直到最大偏差小于阈值，返回剩余点的均值。
+    用布尔掩码和增量更新的和代替每轮np.delete重新分配数组。
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    keep = np.ones(vals.shape[0], dtype=bool)
+    count = vals.shape[0]
+    total = vals.sum()
+    dev = np.empty_like(vals)
+    while count > 1:
+        np.abs(total / count - vals, out=dev)
+        dev[~keep] = -1.0
+        max_idx = np.argmax(dev)
+        if dev[max_idx] < threshold:
+            break
+        keep[max_idx] = False
+        total -= vals[max_idx]
+        count -= 1
+    return total / count
+
+def _unwrap_axis0(phase):
+    """
+    沿轴0解相位缠绕。补偿量以整数周期数累计（rint结果为精确整数，
+    cumsum无舍入误差），避免np.unwrap逐段浮点补偿累加的舍入漂移，
+    同时少生成两个中间数组。
+    """
+    tau = 2.0 * np.pi
+    steps = np.rint(np.diff(phase, axis=0) / tau)
+    np.cumsum(steps, axis=0, out=steps)
+    out = phase.copy()
+    out[1:] -= tau * steps
+    return out
+
+# logo缓存：磁盘IO和平滑缩放每个进程只做一次
+_LOGO_CACHE = {}
+
+def _load_logo(height=26):
+    """加载并缩放ASTRI logo，结果按高度缓存；文件缺失时返回空QPixmap"""
+    if height not in _LOGO_CACHE:
+        pixmap = QPixmap("images/astri_logo.png")
+        if pixmap.isNull():
+            _LOGO_CACHE[height] = QPixmap()
+        else:
+            _LOGO_CACHE[height] = pixmap.scaledToHeight(height, Qt.SmoothTransformation)
+    return _LOGO_CACHE[height]
+
+# BR/HR卡片的对角渐变色标
+_BR_CARD_STOPS = [(0.0, '#e3f2fd'), (0.3, '#bbdefb'), (0.7, '#90caf9'), (1.0, '#64b5f6')]
+_HR_CARD_STOPS = [(0.0, '#fff3e0'), (0.3, '#ffe0b2'), (0.7, '#ffcc80'), (1.0, '#ffb74d')]
+
+class GradientCard(QWidget):
+    """
+    渐变背景卡片
+    背景在resize时渲染到缓存的QPixmap，此后每次repaint只做一次位图拷贝，
+    避免Qt反复光栅化qlineargradient+圆角样式
+    """
+    def __init__(self, stops, radius=20, parent=None):
+        super().__init__(parent)
+        self._stops = stops
+        self._radius = radius
+        self._bg = None
+
+    def resizeEvent(self, event):
+        # 尺寸变化时重建背景位图
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        grad = QLinearGradient(0, 0, self.width(), self.height())
+        for pos, color in self._stops:
+            grad.setColorAt(pos, QColor(color))
+        painter.setBrush(QBrush(grad))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        painter.end()
+        self._bg = pixmap
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self._bg is not None:
+            QPainter(self).drawPixmap(0, 0, self._bg)
+
+class MinuteAxis(pg.AxisItem):
+    """
+    底部时间轴（分钟）
+    根据当前视图范围按需生成整分钟主刻度和10秒副刻度，
+    时间窗滑动时无需重建刻度列表
+    """
+    def tickValues(self, minVal, maxVal, size):
+        major = [v for v in range(int(ceil(minVal)), int(maxVal) + 1)]
+        minor = [i / 6 for i in range(int(ceil(minVal * 6)), int(maxVal * 6) + 1)
+                 if i % 6 != 0]
+        return [(1.0, major), (1 / 6, minor)]
+
+    def tickStrings(self, values, scale, spacing):
+        # 只有整分钟主刻度带文字，副刻度留空
+        if spacing >= 1:
+            return [str(int(v)) for v in values]
+        return ['' for _ in values]
+
 class VitalSignsGUI(QMainWindow):
     """
     生命体征监测GUI主界面类
@@ -65,15 +305,37 @@ class VitalSignsGUI(QMainWindow):
         self.setFont(self.default_font)
         
         # 初始化数据存储变量
-        self.data_queue = queue.Queue()      # 数据队列，用于线程间通信
-        self.recorded_frames = []            # 记录的雷达帧数据
-        self.time_points = []               # 时间点数据（分钟）
-        self.br_values = []                 # 呼吸率数值列表
-        self.hr_values = []                 # 心率数值列表
+        self.data_queue = _FrameBuffer()     # 无锁帧缓冲，用于线程间通信
+        # 帧环形缓冲区：按首帧形状惰性分配，处理周期不再做列表→ndarray整体拷贝
+        self._frame_ring = None              # (FRAME_BATCH, chirp, rx, sample)
+        self._ring_wr = 0                    # 环形写索引（指向最旧帧）
+        self._ring_fill = 0                  # 逻辑持有的帧数（≤FRAME_BATCH）
+        # 预分配的环形缓冲区（内存有界，避免列表每次setData重新转换为ndarray）
+        self.time_points = np.empty(MAX_POINTS, dtype=np.float32)  # 时间点数据（分钟）
+        self.br_values = np.empty(MAX_POINTS, dtype=np.float32)    # 呼吸率数值
+        self.hr_values = np.empty(MAX_POINTS, dtype=np.float32)    # 心率数值
+        self._wr = 0                        # 环形缓冲区写索引（累计写入点数）
         self.point_count = 0                # 数据点计数器
-        
+        self._clk = QElapsedTimer()         # 单调时钟，为时间轴提供时间戳
+        self._last_x_end = None             # 上次设置的时间窗终点（整数分钟）
+
+        # 串口枚举缓存（comports在Windows上扫描注册表，代价较高）
+        self._last_ports_t = 0.0            # 上次枚举的单调时间戳
+        self._last_ports = None             # 上次枚举得到的端口列表
+
         # 雷达配置参数
         self.num_adc_samples = 128          # ADC采样点数
+        self._hann_cache = {}               # 按长度缓存的汉宁窗（float32）
+        self._fft_in = None                 # 复用的加窗FFT输入缓冲
+        # 单线程IO池：.mat落盘在后台进行，不阻塞GUI事件循环
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # 跨批增量解缠绕状态：目标bin未变时复用上一批的解缠绕结果
+        self._ring_new = 0                  # 自上次处理以来写入的新帧数
+        self._unwrap_bin = None             # 上一批的目标距离bin
+        self._prev_unwrapped = None         # 上一批的解缠绕相位(1024, rx)
+        # 分析器构造一次复用，使其内部缓存（频率轴等）跨周期生效
+        self.range_analyzer = RangeBinAnalyzer()    # 距离区间分析器
+        self.vital_analyzer = VitalSignsAnalyzer()  # 生命体征分析器
         self.BR = None                      # 原始呼吸率数据
         self.HR = None                      # 原始心率数据
         
@@ -89,26 +351,6 @@ class VitalSignsGUI(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        # 设置全局样式表，消除所有可能的边框问题
-        self.setStyleSheet("""
-            QWidget {
-                outline: none;
-                border: none;
-            }
-            QWidget:focus {
-                outline: none;
-                border: none;
-            }
-            QLabel {
-                outline: none;
-                border: none;
-            }
-            QVBoxLayout, QHBoxLayout {
-                outline: none;
-                border: none;
-            }
-        """)
-        
         # 创建主布局（垂直布局）
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)  # 去除边距
@@ -117,12 +359,7 @@ class VitalSignsGUI(QMainWindow):
         # === 创建顶部标题栏 ===
         top_widget = QWidget()
         top_widget.setFixedHeight(80)  # 固定高度80像素
-        # 设置蓝色渐变背景
-        top_widget.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                        stop:0 #1976d2, stop:1 #2196f3);
-            border-radius: 8px;
-        """)
+        top_widget.setObjectName("topBar")  # 蓝色渐变背景（见全局样式表）
         
         # 顶部标题栏水平布局
         top_layout = QHBoxLayout(top_widget)
@@ -131,118 +368,40 @@ class VitalSignsGUI(QMainWindow):
         
         # 创建主标题
         title_label = QLabel("生命体征实时监测系统")
-        title_label.setStyleSheet("""
-            color: white;
-            font-size: 28px;
-            font-weight: bold;
-            background: transparent;
-        """)
+        title_label.setObjectName("titleLabel")
         
         # === 创建控制面板 ===
         control_widget = QWidget()
-        control_widget.setStyleSheet("background: transparent;")
+        control_widget.setObjectName("controlPanel")
         control_layout = QHBoxLayout(control_widget)
         control_layout.setContentsMargins(0, 0, 0, 0)
         control_layout.setSpacing(15)  # 控件间距
         
         # 串口选择标签
         port_label = QLabel("串口:")
-        port_label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            background: transparent;
-        """)
+        port_label.setObjectName("portLabel")
         
         # 串口选择下拉框
         self.port_combo = QComboBox()
         self.port_combo.setFixedSize(120, 35)  # 固定尺寸
-        self.port_combo.setStyleSheet("""
-            QComboBox {
-                background-color: white;
-                border: 2px solid #1565c0;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 12px;
-                font-weight: bold;
-                color: #1565c0;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #1565c0;
-            }
-        """)
+        self.port_combo.setObjectName("portCombo")
         
         # 刷新串口按钮
         self.refresh_button = QPushButton("🔄刷新")
         self.refresh_button.setFixedSize(80, 35)
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.9);
-                border: 2px solid white;
-                border-radius: 8px;
-                color: #1976d2;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: white;
-                border-color: #42a5f5;
-            }
-            QPushButton:pressed {
-                background-color: #e3f2fd;
-            }
-        """)
+        self.refresh_button.setObjectName("refreshButton")
         self.refresh_button.clicked.connect(self.refresh_ports)  # 连接刷新方法
         
         # === 清空日志按钮 ===
         self.clear_logs_button = QPushButton("🧹清空日志")
         self.clear_logs_button.setFixedSize(90, 35)
-        self.clear_logs_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ffeb3b;
-                border: 2px solid #fbc02d;
-                border-radius: 8px;
-                color: #bf360c;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #fffde7;
-                border-color: #fbc02d;
-            }
-            QPushButton:pressed {
-                background-color: #ffe082;
-            }
-        """)
+        self.clear_logs_button.setObjectName("clearLogsButton")
         self.clear_logs_button.clicked.connect(self.clear_logs)
         
         # 开始/停止监测按钮
         self.start_button = QPushButton("▶ 开始监测")
         self.start_button.setFixedSize(120, 35)
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                border: 2px solid #4caf50;
-                border-radius: 8px;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #66bb6a;
-                border-color: #66bb6a;
-            }
-            QPushButton:pressed {
-                background-color: #389e0d;
-            }
-        """)
+        self.start_button.setObjectName("startButton")
         self.start_button.clicked.connect(self.start_acquisition)  # 连接开始采集方法
         
         # 将控件添加到控制面板布局
@@ -254,18 +413,13 @@ class VitalSignsGUI(QMainWindow):
         
         # === ASTRI Logo ===
         logo_container = QWidget()
-        logo_container.setStyleSheet("""
-            background-color: rgba(255, 255, 255, 0.1);
-            border: none;
-            border-radius: 6px;
-        """)
+        logo_container.setObjectName("logoContainer")
         logo_layout = QHBoxLayout(logo_container)
         logo_layout.setContentsMargins(10, 4, 10, 4)
         
-        # 加载并缩放logo图片
+        # 加载并缩放logo图片（带缓存）
         logo_label = QLabel()
-        pixmap = QPixmap("images/astri_logo.png")
-        logo_label.setPixmap(pixmap.scaledToHeight(26, Qt.SmoothTransformation))
+        logo_label.setPixmap(_load_logo())
         logo_layout.addWidget(logo_label)
         
         # 将组件添加到顶部布局
@@ -282,17 +436,15 @@ class VitalSignsGUI(QMainWindow):
         
         # === 创建主要内容区域 ===
         content_widget = QWidget()
-        content_widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #e8e8e8;
-            border-radius: 8px;
-        """)
+        content_widget.setObjectName("contentCard")
         content_layout = QHBoxLayout(content_widget)
         content_layout.setContentsMargins(15, 15, 15, 15)
         content_layout.setSpacing(20)
         
         # === 配置图表区域 ===
-        pg.setConfigOptions(antialias=True)  # 启用抗锯齿
+        # 实时滚动曲线10Hz刷新下抗锯齿的视觉收益很小，但走Qt慢速光栅路径，
+        # 关闭以降低绘制CPU
+        pg.setConfigOptions(antialias=False)
         plot_widget = pg.GraphicsLayoutWidget()
         plot_widget.setBackground('w')      # 白色背景
         plot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -306,7 +458,7 @@ class VitalSignsGUI(QMainWindow):
         values_widget.setMinimumWidth(min_width)
         # 不设置最大宽度，让其自适应
         values_widget.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        values_widget.setStyleSheet("background-color: transparent;")
+        values_widget.setObjectName("valuesPanel")
         
         values_layout = QVBoxLayout(values_widget)
         # 使用紧凑边距
@@ -314,27 +466,14 @@ class VitalSignsGUI(QMainWindow):
         values_layout.setSpacing(8)
         
         # === 呼吸率卡片 ===
-        br_card = QWidget()
+        br_card = GradientCard(_BR_CARD_STOPS)
         br_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         # 使用相对高度，但设置合理的最小/最大值
         min_card_height = max(140, int(self.screen_height * 0.16))
         max_card_height = min(220, int(self.screen_height * 0.22))
         br_card.setMinimumHeight(min_card_height)
         br_card.setMaximumHeight(max_card_height)
-        br_card.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #e3f2fd, stop:0.3 #bbdefb, 
-                    stop:0.7 #90caf9, stop:1 #64b5f6);
-                border: none;
-                border-radius: 20px;
-                outline: none;
-            }
-            QWidget:focus {
-                border: none;
-                outline: none;
-            }
-        """)
+        br_card.setObjectName("brCard")
         br_card.setFocusPolicy(Qt.NoFocus)
         br_main_layout = QVBoxLayout(br_card)
         card_margin = max(8, int(self.screen_height * 0.01))
@@ -343,28 +482,16 @@ class VitalSignsGUI(QMainWindow):
         # 顶部装饰条
         br_decorator = QWidget()
         br_decorator.setFixedHeight(max(3, int(self.screen_height * 0.005)))
-        br_decorator.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                stop:0 #1976d2, stop:1 #42a5f5); 
-            border-radius: 2px;
-            border: none;
-        """)
+        br_decorator.setObjectName("brDecorator")
         br_main_layout.addWidget(br_decorator)
         # --- 距离显示标签，移除这里的添加 ---
         self.br_distance_label = QLabel("目标距离: -- m")
-        self.br_distance_label.setStyleSheet("""
-            color: #1976d2;
-            font-size: 14px;
-            font-weight: bold;
-            background: transparent;
-            border: none;
-            outline: none;
-        """)
+        self.br_distance_label.setObjectName("brDistanceLabel")
         self.br_distance_label.setAlignment(Qt.AlignCenter)
         # br_main_layout.addWidget(self.br_distance_label)  # 注释掉原来的位置
         # 图标+标题组
         br_title_row = QWidget()
-        br_title_row.setStyleSheet("background: transparent; border: none; outline: none;")
+        br_title_row.setObjectName("brTitleRow")
         br_title_row.setFocusPolicy(Qt.NoFocus)
         br_title_row_layout = QHBoxLayout(br_title_row)
         title_margin = max(5, int(self.screen_width * 0.005))
@@ -373,29 +500,19 @@ class VitalSignsGUI(QMainWindow):
         icon_size = max(30, min(50, int(min(self.screen_width, self.screen_height) * 0.04)))
         br_icon_container = QWidget()
         br_icon_container.setFixedSize(icon_size, icon_size)
-        br_icon_container.setStyleSheet(f"""
-            background: rgba(255,255,255,0.95); 
-            border-radius: {icon_size//2}px; 
-            border: none;
-            outline: none;
-        """)
+        br_icon_container.setObjectName("brIconContainer")
         br_icon_container.setFocusPolicy(Qt.NoFocus)
         br_icon_layout = QVBoxLayout(br_icon_container)
         br_icon_layout.setContentsMargins(0,0,0,0)
         br_icon_layout.setAlignment(Qt.AlignCenter)
         br_icon_label = QLabel("🫁")
         icon_font_size = max(16, int(icon_size * 0.6))
-        br_icon_label.setStyleSheet(f"""
-            background: transparent; 
-            border: none; 
-            font-size: {icon_font_size}px;
-            outline: none;
-        """)
+        br_icon_label.setObjectName("brIconLabel")
         br_icon_label.setAlignment(Qt.AlignCenter)
         br_icon_label.setFocusPolicy(Qt.NoFocus)
         br_icon_layout.addWidget(br_icon_label)
         br_text_group = QWidget()
-        br_text_group.setStyleSheet("background: transparent; border: none; outline: none;")
+        br_text_group.setObjectName("brTextGroup")
         br_text_group.setFocusPolicy(Qt.NoFocus)
         br_text_layout = QVBoxLayout(br_text_group)
         br_text_layout.setContentsMargins(0, 0, 0, 0)
@@ -403,24 +520,10 @@ class VitalSignsGUI(QMainWindow):
         title_font = max(16, min(24, int(self.screen_height * 0.022)))
         subtitle_font = max(10, min(16, int(self.screen_height * 0.013)))
         br_chinese = QLabel("呼吸率")
-        br_chinese.setStyleSheet(f"""
-            color: #0d47a1; 
-            font-size: {title_font}px; 
-            font-weight: bold; 
-            background: transparent; 
-            border: none;
-            outline: none;
-        """)
+        br_chinese.setObjectName("brChinese")
         br_chinese.setFocusPolicy(Qt.NoFocus)
         br_english = QLabel("Breathing Rate")
-        br_english.setStyleSheet(f"""
-            color: #1976d2; 
-            font-size: {subtitle_font}px; 
-            font-weight: 500; 
-            background: transparent; 
-            border: none;
-            outline: none;
-        """)
+        br_english.setObjectName("brEnglish")
         br_english.setFocusPolicy(Qt.NoFocus)
         br_text_layout.addWidget(br_chinese)
         br_text_layout.addWidget(br_english)
@@ -433,18 +536,7 @@ class VitalSignsGUI(QMainWindow):
         # --- 数值显示区域（垂直居中，数字和单位同一行） ---
         br_value_area = QWidget()
         br_value_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        br_value_area.setStyleSheet("""
-            QWidget {
-                background: rgba(255,255,255,0.95); 
-                border-radius: 15px; 
-                border: none;
-                outline: none;
-            }
-            QWidget:focus {
-                border: none;
-                outline: none;
-            }
-        """)
+        br_value_area.setObjectName("brValueArea")
         br_value_area.setFocusPolicy(Qt.NoFocus)
         br_value_vlayout = QVBoxLayout(br_value_area)
         br_value_vlayout.setContentsMargins(0, 0, 0, 0)
@@ -455,25 +547,17 @@ class VitalSignsGUI(QMainWindow):
         br_value_hlayout.setSpacing(8)
         br_value_hlayout.addStretch(1)
         value_font = max(32, min(72, int(self.screen_height * 0.06)))
+        # 数值标签按最宽文本定宽，setText时几何不变，不会触发父布局重算
+        value_metrics_font = QFont(self.default_font.family())
+        value_metrics_font.setPixelSize(value_font)
+        value_metrics_font.setBold(True)
+        value_label_width = QFontMetrics(value_metrics_font).horizontalAdvance("888.8")
         self.br_value_label = QLabel("0.0")
-        self.br_value_label.setStyleSheet(f"""
-            color: #0d47a1;
-            font-size: {value_font}px;
-            font-weight: 900;
-            background: transparent;
-            border: none;
-            outline: none;
-        """)
+        self.br_value_label.setObjectName("brValueLabel")
+        self.br_value_label.setFixedWidth(value_label_width)
         self.br_value_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
         br_unit = QLabel("BPM")
-        br_unit.setStyleSheet(f"""
-            color: #1565c0;
-            font-size: {int(value_font*0.45)}px;
-            font-weight: bold;
-            background: transparent;
-            border: none;
-            outline: none;
-        """)
+        br_unit.setObjectName("brUnit")
         br_unit.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         br_value_hlayout.addWidget(self.br_value_label)
         br_value_hlayout.addWidget(br_unit)
@@ -482,90 +566,48 @@ class VitalSignsGUI(QMainWindow):
         br_value_vlayout.addStretch(1)
         br_main_layout.addWidget(br_value_area)
         # === 心率卡片 ===
-        hr_card = QWidget()
+        hr_card = GradientCard(_HR_CARD_STOPS)
         hr_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         hr_card.setMinimumHeight(min_card_height)
         hr_card.setMaximumHeight(max_card_height)
-        hr_card.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #fff3e0, stop:0.3 #ffe0b2, 
-                    stop:0.7 #ffcc80, stop:1 #ffb74d);
-                border: none;
-                border-radius: 20px;
-                outline: none;
-            }
-            QWidget:focus {
-                border: none;
-                outline: none;
-            }
-        """)
+        hr_card.setObjectName("hrCard")
         hr_card.setFocusPolicy(Qt.NoFocus)
         hr_main_layout = QVBoxLayout(hr_card)
         hr_main_layout.setContentsMargins(card_margin, card_margin, card_margin, card_margin)
         hr_main_layout.setSpacing(max(4, int(self.screen_height * 0.006)))
         hr_decorator = QWidget()
         hr_decorator.setFixedHeight(max(3, int(self.screen_height * 0.005)))
-        hr_decorator.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                stop:0 #f57c00, stop:1 #ff9800); 
-            border-radius: 2px;
-            border: none;
-        """)
+        hr_decorator.setObjectName("hrDecorator")
         hr_main_layout.addWidget(hr_decorator)
         hr_title_row = QWidget()
-        hr_title_row.setStyleSheet("background: transparent; border: none; outline: none;")
+        hr_title_row.setObjectName("hrTitleRow")
         hr_title_row.setFocusPolicy(Qt.NoFocus)
         hr_title_row_layout = QHBoxLayout(hr_title_row)
         hr_title_row_layout.setContentsMargins(title_margin, 0, title_margin, 0)
         hr_title_row_layout.setSpacing(max(8, int(self.screen_width * 0.008)))
         hr_icon_container = QWidget()
         hr_icon_container.setFixedSize(icon_size, icon_size)
-        hr_icon_container.setStyleSheet(f"""
-            background: rgba(255,255,255,0.95); 
-            border-radius: {icon_size//2}px; 
-            border: none;
-            outline: none;
-        """)
+        hr_icon_container.setObjectName("hrIconContainer")
         hr_icon_container.setFocusPolicy(Qt.NoFocus)
         hr_icon_layout = QVBoxLayout(hr_icon_container)
         hr_icon_layout.setContentsMargins(0,0,0,0)
         hr_icon_layout.setAlignment(Qt.AlignCenter)
         hr_icon_label = QLabel("❤️")
-        hr_icon_label.setStyleSheet(f"""
-            background: transparent; 
-            border: none; 
-            font-size: {icon_font_size}px;
-            outline: none;
-        """)
+        hr_icon_label.setObjectName("hrIconLabel")
         hr_icon_label.setAlignment(Qt.AlignCenter)
         hr_icon_label.setFocusPolicy(Qt.NoFocus)
         hr_icon_layout.addWidget(hr_icon_label)
         hr_text_group = QWidget()
-        hr_text_group.setStyleSheet("background: transparent; border: none; outline: none;")
+        hr_text_group.setObjectName("hrTextGroup")
         hr_text_group.setFocusPolicy(Qt.NoFocus)
         hr_text_layout = QVBoxLayout(hr_text_group)
         hr_text_layout.setContentsMargins(0, 0, 0, 0)
         hr_text_layout.setSpacing(2)
         hr_chinese = QLabel("心率")
-        hr_chinese.setStyleSheet(f"""
-            color: #bf360c; 
-            font-size: {title_font}px; 
-            font-weight: bold; 
-            background: transparent; 
-            border: none;
-            outline: none;
-        """)
+        hr_chinese.setObjectName("hrChinese")
         hr_chinese.setFocusPolicy(Qt.NoFocus)
         hr_english = QLabel("Heart Rate")
-        hr_english.setStyleSheet(f"""
-            color: #f57c00; 
-            font-size: {subtitle_font}px; 
-            font-weight: 500; 
-            background: transparent; 
-            border: none;
-            outline: none;
-        """)
+        hr_english.setObjectName("hrEnglish")
         hr_english.setFocusPolicy(Qt.NoFocus)
         hr_text_layout.addWidget(hr_chinese)
         hr_text_layout.addWidget(hr_english)
@@ -576,18 +618,7 @@ class VitalSignsGUI(QMainWindow):
         # --- 数值显示区域（垂直居中，数字和单位同一行） ---
         hr_value_area = QWidget()
         hr_value_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        hr_value_area.setStyleSheet("""
-            QWidget {
-                background: rgba(255,255,255,0.95); 
-                border-radius: 15px; 
-                border: none;
-                outline: none;
-            }
-            QWidget:focus {
-                border: none;
-                outline: none;
-            }
-        """)
+        hr_value_area.setObjectName("hrValueArea")
         hr_value_area.setFocusPolicy(Qt.NoFocus)
         hr_value_vlayout = QVBoxLayout(hr_value_area)
         hr_value_vlayout.setContentsMargins(0, 0, 0, 0)
@@ -598,24 +629,11 @@ class VitalSignsGUI(QMainWindow):
         hr_value_hlayout.setSpacing(8)
         hr_value_hlayout.addStretch(1)
         self.hr_value_label = QLabel("0.0")
-        self.hr_value_label.setStyleSheet(f"""
-            color: #bf360c;
-            font-size: {value_font}px;
-            font-weight: 900;
-            background: transparent;
-            border: none;
-            outline: none;
-        """)
+        self.hr_value_label.setObjectName("hrValueLabel")
+        self.hr_value_label.setFixedWidth(value_label_width)
         self.hr_value_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
         hr_unit = QLabel("BPM")
-        hr_unit.setStyleSheet(f"""
-            color: #e65100;
-            font-size: {int(value_font*0.45)}px;
-            font-weight: bold;
-            background: transparent;
-            border: none;
-            outline: none;
-        """)
+        hr_unit.setObjectName("hrUnit")
         hr_unit.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         hr_value_hlayout.addWidget(self.hr_value_label)
         hr_value_hlayout.addWidget(hr_unit)
@@ -639,11 +657,7 @@ class VitalSignsGUI(QMainWindow):
         
         # 底部进度条
         progress_widget = QWidget()
-        progress_widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #e8e8e8;
-            border-radius: 8px;
-        """)
+        progress_widget.setObjectName("progressCard")
         progress_widget.setFixedHeight(60)
         progress_layout = QVBoxLayout(progress_widget)
         progress_layout.setContentsMargins(20, 15, 20, 15)
@@ -652,29 +666,27 @@ class VitalSignsGUI(QMainWindow):
         self.progress_bar.setMaximum(1024)
         self.progress_bar.setFormat("数据采集进度: %v/1024 (%p%)")
         self.progress_bar.setFixedHeight(20)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #d9d9d9;
-                border-radius: 10px;
-                text-align: center;
-                font-size: 12px;
-                font-weight: bold;
-                color: #595959;
-                background-color: #f5f5f5;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                                          stop:0 #1890ff, stop:1 #40a9ff);
-                border-radius: 9px;
-            }
-        """)
+        self.progress_bar.setObjectName("progressBar")
         
         progress_layout.addWidget(self.progress_bar)
         main_layout.addWidget(progress_widget)
-        
+
+        # === 全局样式表 ===
+        # 像素尺寸集中算入一张表，模板一次format_map完成全部插值
+        dims = {
+            'icon_radius': icon_size // 2,
+            'icon_font': icon_font_size,
+            'title_font': title_font,
+            'subtitle_font': subtitle_font,
+            'value_font': value_font,
+            'unit_font': int(value_font * 0.45),
+        }
+        QApplication.instance().setStyleSheet(_APP_QSS.format_map(dims))
+
         # 配置图表
         # 配置呼吸率图表
-        self.br_plot = plot_widget.addPlot(row=0, col=0)
+        self.br_plot = plot_widget.addPlot(row=0, col=0,
+                                           axisItems={'bottom': MinuteAxis(orientation='bottom')})
         self.br_plot.setContentsMargins(150, 0, 0, 0)
         self.br_plot.setTitle("🫁呼吸率监测 Breathing Rate Monitor", size="16pt", color='#1565c0')
         labelStyle = {'color': '#424242', 'font-size': '13pt', 'font-family': 'Microsoft YaHei'}
@@ -689,28 +701,27 @@ class VitalSignsGUI(QMainWindow):
         self.br_plot.setYRange(10, 40, padding=0)
         self.br_plot.getAxis('left').setTicks([[(i, str(i)) for i in range(10, 41, 5)]])
         
-        # 设置X轴刻度（时间，分钟）
-        self.num_points=0;
-        self.TimeEnd = (self.num_points-1)/6;
-        if self.TimeEnd <= 6:
-            self.TimeEnd = 6;
-    
-        major_ticks = [(i, str(i)) for i in range(self.TimeEnd-6,self.TimeEnd+2)]
-        minor_ticks = [(i/6, '') for i in range((self.TimeEnd-6)*6,(self.TimeEnd+1)*6) if i % 6 != 0]
-        self.br_plot.getAxis('bottom').setTicks([major_ticks, minor_ticks])
+        # 设置X轴时间窗（刻度由MinuteAxis根据视图范围按需生成）
+        self.num_points = 0
+        self.TimeEnd = 6
         self.br_plot.setXRange(self.TimeEnd-6,self.TimeEnd, padding=0.01)
 
         
         # 配置呼吸率曲线样式
-        self.br_curve = self.br_plot.plot(pen=pg.mkPen('#1976d2', width=4),
-                                        symbol='o',
-                                        symbolSize=6,
-                                        symbolBrush='#42a5f5',
-                                        symbolPen=pg.mkPen('#1565c0', width=2))
+        # 历史曲线不逐点绘制符号（符号数量随点数线性增加绘制开销），
+        # 只为最近的点叠加一个带位图缓存的散点图层
+        self.br_curve = self.br_plot.plot(pen=_BR_PEN)
+        # 只绘制可见时间窗内的数据，长时间运行后主线程绘制开销保持恒定
+        self.br_plot.setClipToView(True)
+        self.br_curve.setDownsampling(auto=True, method='peak')  # 峰值保留降采样，顶点数≈视宽
+        self.br_scatter = pg.ScatterPlotItem(size=6, brush=_BR_SYM_BRUSH,
+                                             pen=_BR_SYM_PEN, useCache=True, pxMode=True)
+        self.br_plot.addItem(self.br_scatter)
         
         # 配置心率图表
         plot_widget.nextRow()
-        self.hr_plot = plot_widget.addPlot(row=1, col=0)
+        self.hr_plot = plot_widget.addPlot(row=1, col=0,
+                                           axisItems={'bottom': MinuteAxis(orientation='bottom')})
         self.hr_plot.setContentsMargins(150, 0, 0, 0)
         self.hr_plot.setTitle("❤️心率监测 Heart Rate Monitor", size="16pt", color='#e65100')
         self.hr_plot.setLabel('left', text='心率 (BPM)', **labelStyle)
@@ -723,16 +734,16 @@ class VitalSignsGUI(QMainWindow):
         self.hr_plot.showAxis('bottom')
         self.hr_plot.setYRange(40, 140, padding=0)  # 从40-120扩大到40-140
         self.hr_plot.getAxis('left').setTicks([[(i, str(i)) for i in range(40, 141, 20)]])  # 刻度间隔改为20
-        self.hr_plot.getAxis('bottom').setTicks([major_ticks, minor_ticks])
         self.hr_plot.setXRange(self.TimeEnd-6,self.TimeEnd, padding=0.01)
         
         
         # 配置心率曲线样式
-        self.hr_curve = self.hr_plot.plot(pen=pg.mkPen('#f57c00', width=4),
-                                        symbol='o',
-                                        symbolSize=6,
-                                        symbolBrush='#ff9800',
-                                        symbolPen=pg.mkPen('#e65100', width=2))
+        self.hr_curve = self.hr_plot.plot(pen=_HR_PEN)
+        self.hr_plot.setClipToView(True)
+        self.hr_curve.setDownsampling(auto=True, method='peak')
+        self.hr_scatter = pg.ScatterPlotItem(size=6, brush=_HR_SYM_BRUSH,
+                                             pen=_HR_SYM_PEN, useCache=True, pxMode=True)
+        self.hr_plot.addItem(self.hr_scatter)
         
         # 初始化定时器
         self.update_timer = QTimer()  # 创建定时器
@@ -747,22 +758,33 @@ class VitalSignsGUI(QMainWindow):
             os.makedirs(log_dir)
         now = datetime.now()
         self.log_file = os.path.join(log_dir, f"vitals_{now.strftime('%Y%m%d_%H%M%S')}.txt")
+        # 整个会话保持一个带缓冲的句柄，不再每个周期重新open/close
+        self._log_fp = open(self.log_file, 'a', buffering=8192)
 
     def refresh_ports(self):
-        """刷新并更新可用串口列表"""
-        self.port_combo.clear()  # 清空串口下拉框
+        """刷新并更新可用串口列表（1秒内的重复点击直接复用缓存）"""
+        # 防抖：comports()在Windows上每次都扫描注册表，连续点击没有意义
+        now = time.monotonic()
+        if self._last_ports is not None and now - self._last_ports_t < 1.0:
+            return
+        self._last_ports_t = now
+
         # 获取所有可用串口
         ports = [port.device for port in serial.tools.list_ports.comports()]
-        
+
         # 确保COM16在列表中（默认端口）
         default_port = "COM16"
         if default_port not in ports:
             ports.append(default_port)  # 如果COM16不在列表中，添加它
-        
+
         # 排序并添加端口列表
         ports.sort()  # 对端口列表进行排序
+        if ports == self._last_ports:
+            return  # 端口集合没有变化，跳过下拉框重建
+        self._last_ports = ports
+        self.port_combo.clear()  # 清空串口下拉框
         self.port_combo.addItems(ports)  # 将端口添加到下拉框
-        
+
         # 设置COM16为默认选项
         default_index = self.port_combo.findText(default_port)  # 查找COM16的索引
         if default_index >= 0:
@@ -775,8 +797,13 @@ class VitalSignsGUI(QMainWindow):
                 port = self.port_combo.currentText()  # 获取选中的串口
                 # 重置数据存储
                 self.point_count = 0  # 重置点计数器
-                self.br_values = []  # 清空呼吸率值列表
-                self.hr_values = []  # 清空心率值列表
+                self._wr = 0  # 重置环形缓冲区写索引
+                self._ring_wr = 0  # 重置帧环形缓冲区
+                self._ring_fill = 0
+                self._ring_new = 0
+                self._prev_unwrapped = None
+                self._last_x_end = None
+                self._clk.start()  # 启动单调时钟
                 
                 # 初始化ADC读取器
                 self.adc_reader = AdcReader(  # 创建ADC读取器实例
@@ -804,62 +831,102 @@ class VitalSignsGUI(QMainWindow):
             self.port_combo.setEnabled(True)  # 启用串口选择
             self.refresh_button.setEnabled(True)  # 启用刷新按钮
             self.progress_bar.setValue(0)  # 重置进度条
-            self.recorded_frames = []
-            self.br_values = []
-            self.hr_values = []
+            self._ring_wr = 0
+            self._ring_fill = 0
+            self._ring_new = 0
+            self._prev_unwrapped = None
+            self._wr = 0
             self.num_points = 0
             self.TimeEnd = 0
             
+    def _ring_snapshot(self):
+        """按时间顺序返回帧环形缓冲区的内容（写索引处为最旧帧）"""
+        if self._ring_wr == 0:
+            return self._frame_ring  # 恰好对齐时直接返回缓冲区，零拷贝
+        return np.concatenate((self._frame_ring[self._ring_wr:],
+                               self._frame_ring[:self._ring_wr]))
+
     def update_data(self):
         """更新数据显示的方法"""
-        # 从队列中获取数据
-        while not self.data_queue.empty():  # 当队列不为空时
-            frame = self.data_queue.get()  # 获取一帧数据
-            self.recorded_frames.append(frame)  # 将数据添加到记录列表
-            
+        # 一次性批量排空帧缓冲（popleft为原子操作，无锁），直接写入环形缓冲区
+        buf = self.data_queue
+        drained = 0
+        try:
+            while True:
+                frame = buf.popleft()
+                if self._frame_ring is None:
+                    # 帧形状运行时才可知，收到首帧后一次性分配
+                    self._frame_ring = np.empty((FRAME_BATCH,) + frame.shape,
+                                                dtype=frame.dtype)
+                self._frame_ring[self._ring_wr] = frame
+                # 数据已拷入环形缓冲区，把帧槽还给读取器的空闲池复用
+                # （停止采集后队列中可能残留帧，此时读取器已置空，直接丢弃）
+                if self.adc_reader is not None:
+                    self.adc_reader.release(frame)
+                self._ring_wr = (self._ring_wr + 1) % FRAME_BATCH
+                if self._ring_fill < FRAME_BATCH:
+                    self._ring_fill += 1
+                self._ring_new += 1
+                drained += 1
+        except IndexError:
+            pass
+
+        # 本周期没有新帧时直接返回，不触碰任何GUI对象
+        if drained == 0:
+            return
+
         # 更新进度条
-        self.progress_bar.setValue(len(self.recorded_frames))  # 更新进度条值
-        
+        self.progress_bar.setValue(self._ring_fill)  # 更新进度条值
+
         # 当收集到足够的帧数时处理数据
-        if len(self.recorded_frames) >= 1024:  # 如果收集到1024帧数据
-        # if len(self.recorded_frames) >= 100:
-            self.adc_reader.save_to_npz(
+        if self._ring_fill >= FRAME_BATCH:  # 如果收集到1024帧数据
+            frames = self._ring_snapshot()
+            if frames is self._frame_ring:
+                frames = frames.copy()  # 后台保存期间环形缓冲区会继续被写入
+            # 落盘是IO密集操作，放到后台线程，与下一周期的FFT/分析重叠
+            self._io_pool.submit(
+                self.adc_reader.save_to_npz,
                 file_path=f"logs/frame_dump_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mat",
                 config_metadata=self.adc_reader.get_radar_config(),
-                recorded_frames=self.recorded_frames
+                recorded_frames=frames
             )
-            self.process_frames()  # 处理数据帧
-            
-    def process_frames(self):
+            self.process_frames(frames)  # 处理数据帧
+
+    def process_frames(self, frames):
         """处理雷达数据帧的方法"""
         try:
-            # 将数据帧转换为numpy数组
-            recorded_frames_array = np.array(self.recorded_frames)  # 转换为numpy数组
-            selected_chirp = recorded_frames_array[:, 0, :, :]  # 选择第一个chirp信号
+            selected_chirp = frames[:, 0, :, :]  # 选择第一个chirp信号
             
             # 获取实际的ADC采样点数
             actual_adc_samples = selected_chirp.shape[-1]  # 获取最后一个维度的大小
 
             
-            # 应用汉宁窗（使用实际的采样点数）
-            window = np.hanning(actual_adc_samples)  # 创建汉宁窗
-            chirp_windowed = selected_chirp * window  # 应用窗函数
-            
-            # FFT处理
-            range_fft_complex = np.fft.fft(chirp_windowed, n=actual_adc_samples, axis=2)  # 进行FFT变换
+            # 应用汉宁窗（采样点数在会话中不变，窗按长度缓存只算一次）
+            window = self._hann_cache.get(actual_adc_samples)
+            if window is None:
+                window = np.hanning(actual_adc_samples).astype(np.float32)
+                self._hann_cache[actual_adc_samples] = window
+            # 加窗结果写入常驻缓冲区，避免每周期分配一个MB级临时数组；
+            # ADC帧为实数float32，整条流水线保持FP32（带宽减半、SIMD通道翻倍）
+            if self._fft_in is None or self._fft_in.shape != selected_chirp.shape:
+                self._fft_in = np.empty(selected_chirp.shape, dtype=np.float32)
+            chirp_windowed = np.multiply(selected_chirp, window, out=self._fft_in)  # 应用窗函数
+
+            # FFT处理：输入为实序列，rfft只算非负频率半谱；
+            # scipy.fft缓存变换计划并用workers沿批量维度多线程计算
+            range_fft_complex = sp_fft.rfft(chirp_windowed, n=actual_adc_samples,
+                                            axis=2, workers=-1)
             range_fft_magnitude = np.abs(range_fft_complex[:, :, :actual_adc_samples // 2])  # 计算幅度谱
             
             # 寻找目标距离区间
-            analyzer = RangeBinAnalyzer()  # 创建距离区间分析器
-            max_range_bin = analyzer.range_bin(range_fft_magnitude, display_or_not=False)  # 获取最大回波区间
+            max_range_bin = self.range_analyzer.range_bin(range_fft_magnitude, display_or_not=False)  # 获取最大回波区间
             # --- 计算距离并更新标签 ---
             if(max_range_bin == 0):
                 self.br_distance_label.setText("<font color='red'>没有检测到胸腔</font>")
-                self.recorded_frames = [];
                 self.progress_bar.setValue(0)  # 重置进度条
-                self.recorded_frames = []
-                self.br_values = []
-                self.hr_values = []
+                self._ring_fill = 0
+                self._prev_unwrapped = None  # 帧序列断开，增量解缠绕失效
+                self._wr = 0
                 self.num_points = 0
                 self.TimeEnd = 0
             else:
@@ -870,117 +937,106 @@ class VitalSignsGUI(QMainWindow):
                 # 提取相位数据
                 target_range_bin_complex = range_fft_complex[:,:, max_range_bin]  # 提取目标区间的复数数据
                 phase_raw = np.angle(target_range_bin_complex)  # 计算相位角
-                phase_unwrapped = np.unwrap(phase_raw, axis=0)  # 进行相位解缠绕
+                # 及早释放整个FFT立方体及其幅度谱：相位分析只需(1024, rx)切片，
+                # 在display3s分配2048点FFT缓冲前先把这几MB还给分配器
+                del target_range_bin_complex, range_fft_complex, range_fft_magnitude
+                # 增量解缠绕：目标bin未变且重叠有效时，仅解缠绕新增帧，
+                # 以上一批末尾相位为锚点拼接（相差的整周期常量只进DC bin，
+                # 而DC附近频点在display3s中被置零，不影响BR/HR）
+                n_new = self._ring_new
+                self._ring_new = 0
+                if (max_range_bin == self._unwrap_bin
+                        and self._prev_unwrapped is not None
+                        and 0 < n_new < FRAME_BATCH):
+                    carried = self._prev_unwrapped[n_new:]  # 重叠部分直接复用
+                    seg = _unwrap_axis0(phase_raw[FRAME_BATCH - n_new - 1:])
+                    seg += carried[-1] - seg[0]  # 锚定到上一批末尾
+                    phase_unwrapped = np.concatenate((carried, seg[1:]))
+                else:
+                    phase_unwrapped = _unwrap_axis0(phase_raw)  # 进行相位解缠绕
+                self._unwrap_bin = max_range_bin
+                self._prev_unwrapped = phase_unwrapped
                 
                 # 分析生命体征
-                vital_analyzer = VitalSignsAnalyzer()  # 创建生命体征分析器
                 periodicity = 0.05  # 设置采样周期（秒）
-                self.BR, self.HR = vital_analyzer.display3s(phase_unwrapped, periodicity, display_or_not=False)  # 分析呼吸率和心率
-                
-                # 处理呼吸率数据
-                BR_filtered = self.BR.copy()  # 复制呼吸率数据
-                mb = np.abs(np.mean(BR_filtered) - BR_filtered)  # 计算与均值的偏差
-                while len(BR_filtered) > 1:  # 当还有多个数据点时
-                    max_idx = np.argmax(mb)  # 找到最大偏差的索引
-                    max_val = mb[max_idx]  # 获取最大偏差值
-                    if max_val < 1:  # 如果最大偏差小于1
-                        break  # 退出循环
-                    BR_filtered = np.delete(BR_filtered, max_idx)  # 删除异常值
-                    mb = np.abs(np.mean(BR_filtered) - BR_filtered)  # 重新计算偏差
-                avg_br = np.mean(BR_filtered)  # 计算平均呼吸率
-                
-                # 处理心率数据
-                HR_filtered = self.HR.copy()  # 复制心率数据
-                mb = np.abs(np.mean(HR_filtered) - HR_filtered)  # 计算与均值的偏差
-                while len(HR_filtered) > 1:  # 当还有多个数据点时
-                    max_idx = np.argmax(mb)  # 找到最大偏差的索引
-                    max_val = mb[max_idx]  # 获取最大偏差值
-                    if max_val < 5:  # 如果最大偏差小于5（心率阈值）
-                        break  # 退出循环
-                    HR_filtered = np.delete(HR_filtered, max_idx)  # 删除异常值
-                    mb = np.abs(np.mean(HR_filtered) - HR_filtered)  # 重新计算偏差
-                avg_hr = np.mean(HR_filtered)  # 计算平均心率
+                self.BR, self.HR = self.vital_analyzer.display3s(phase_unwrapped, periodicity, display_or_not=False)  # 分析呼吸率和心率
                 
-                # 数据范围检查和过滤
-                if 9 <= avg_br <= 40:  # 检查呼吸率是否在正常范围内（10-40 BPM）
-                    self.br_values.append(avg_br)  # 添加到呼吸率列表
-                else:
-                    # 如果超出范围，使用默认值或最后一个有效值
-                    if self.br_values:  # 如果列表不为空
-                        self.br_values.append(0)  # 使用最后一个值
-                    else:
-                        self.br_values.append(0)  # 使用默认值20
-                
-                if 40 <= avg_hr <= 200:  # 检查心率是否在正常范围内（40-200 BPM）
-                    self.hr_values.append(avg_hr)  # 添加到心率列表
-                else:
-                    # 如果超出范围，使用默认值或最后一个有效值
-                    if self.hr_values:  # 如果列表不为空
-                        self.hr_values.append(0)  # 使用最后一个值
-                    else:
-                        self.hr_values.append(0)  # 使用默认值80
+                # 剔除离群点并求平均（呼吸率偏差阈值1 BPM，心率阈值5 BPM）
+                avg_br = _filter_outliers(self.BR, 1)  # 平均呼吸率
+                avg_hr = _filter_outliers(self.HR, 5)  # 平均心率
                 
+                # 数据范围检查和过滤（超出正常范围时写0）
+                new_br = avg_br if 9 <= avg_br <= 40 else 0     # 呼吸率正常范围10-40 BPM
+                new_hr = avg_hr if 40 <= avg_hr <= 200 else 0   # 心率正常范围40-200 BPM
+
+                # 写入环形缓冲区（内存有界，旧数据自动被覆盖）
+                idx = self._wr % MAX_POINTS
+                self.br_values[idx] = new_br
+                self.hr_values[idx] = new_hr
+                # 时间戳取自单调时钟（第一个点对齐到t=0），
+                # 不在热路径上构造datetime对象
+                if self._wr == 0:
+                    self._clk.restart()
+                self.time_points[idx] = self._clk.nsecsElapsed() * (1.0 / 60e9)  # ns→分钟
+                self._wr += 1
+
                 self.point_count += 1  # 增加数据点计数
+                self.num_points = self._wr  # 当前数据点数量
                 
-                # 限制数据点数量为37个（对应6分钟滚动窗口）
-                # max_points = 37  # 最大显示37个数据点
-                # if len(self.br_values) > max_points:  # 如果呼吸率数据点超过最大值
-                #     self.br_values = self.br_values[-max_points:]  # 保留最后31个点
-                # if len(self.hr_values) > max_points:  # 如果心率数据点超过最大值
-                #     self.hr_values = self.hr_values[-max_points:]  # 保留最后31个点
-                
-                # 确保三个数组长度一致，计算时间点数组
-                self.num_points = len(self.br_values)  # 当前数据点数量
-                if self.num_points >= 1:  # 如果有多个数据点
-                    self.time_points = [(i-1) / 6 for i in range(self.num_points)]
-                else:
-                    self.time_points = [0]  # 只有一个点时，时间为0
-                
-                # 记录日志信息
-                with open(self.log_file, 'a') as f:
-                    f.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Raw BR: {self.BR}, Filtered avg_br: {avg_br:.2f}\n")
-                    f.write(f"Raw HR: {self.HR}, Filtered avg_hr: {avg_hr:.2f}\n")
-                    f.write("="*50 + "\n")
+                # 记录日志信息（紧凑格式化，避免ndarray的逐元素repr）
+                br_raw = ','.join(f'{v:.3f}' for v in np.ravel(self.BR))
+                hr_raw = ','.join(f'{v:.3f}' for v in np.ravel(self.HR))
+                self._log_fp.write(
+                    f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"Raw BR: [{br_raw}], Filtered avg_br: {avg_br:.2f}\n"
+                    f"Raw HR: [{hr_raw}], Filtered avg_hr: {avg_hr:.2f}\n"
+                    + "="*50 + "\n")
                 
                 # 格式化显示文本
-                br_text = f"{self.br_values[-1]:.1f}"  # 呼吸率文本（保留1位小数）
-                hr_text = f"{self.hr_values[-1]:.1f}"  # 心率文本（保留1位小数）
-                
-                # 只有当有足够数据点时才更新图表
+                br_text = f"{new_br:.1f}"  # 呼吸率文本（保留1位小数）
+                hr_text = f"{new_hr:.1f}"  # 心率文本（保留1位小数）
 
-                self.br_curve.setData(self.time_points, self.br_values)  # 更新呼吸率曲线数据
-                self.hr_curve.setData(self.time_points, self.hr_values)  # 更新心率曲线数据
+                # 按时间顺序取出环形缓冲区中已写入的点，更新图表
+                n = min(self._wr, MAX_POINTS)
+                order = (self._wr - n + np.arange(n)) % MAX_POINTS
+                # 环形缓冲区中只写入有限值，跳过pyqtgraph的NaN/Inf扫描
+                self.br_curve.setData(self.time_points[order], self.br_values[order],
+                                      skipFiniteCheck=True)  # 更新呼吸率曲线数据
+                self.hr_curve.setData(self.time_points[order], self.hr_values[order],
+                                      skipFiniteCheck=True)  # 更新心率曲线数据
+                # 散点只画最近20个点
+                tail = order[-20:]
+                self.br_scatter.setData(self.time_points[tail], self.br_values[tail])
+                self.hr_scatter.setData(self.time_points[tail], self.hr_values[tail])
                 
                 
 
                 self.TimeEnd = (self.num_points-2)/6
                 if self.TimeEnd >=5:
                     self.TimeEnd = ceil(self.TimeEnd)
-                    major_ticks = [(i, str(i)) for i in range(self.TimeEnd-5,self.TimeEnd+3)]
-                    minor_ticks = [(i/6, '') for i in range((self.TimeEnd-5)*6,(self.TimeEnd+2)*6) if i % 6 != 0]
-                    
-                    self.br_plot.getAxis('bottom').setTicks([major_ticks, minor_ticks])
-                    self.br_plot.setXRange(self.TimeEnd-5,self.TimeEnd+2, padding=0.01)
-                    self.hr_plot.getAxis('bottom').setTicks([major_ticks, minor_ticks])
-                    self.hr_plot.setXRange(self.TimeEnd-5,self.TimeEnd+2, padding=0.01)
+                    # 只滑动时间窗，刻度由MinuteAxis随视图范围自动生成；
+                    # 取整后的窗口终点未变时跳过，免去轴的重新刻画
+                    if self.TimeEnd != self._last_x_end:
+                        self._last_x_end = self.TimeEnd
+                        self.br_plot.setXRange(self.TimeEnd-5,self.TimeEnd+2, padding=0.01)
+                        self.hr_plot.setXRange(self.TimeEnd-5,self.TimeEnd+2, padding=0.01)
                 
-                # 无论是否有足够数据，都要更新当前值标签，确保实时显示
-                self.br_value_label.setText(br_text)  # 更新呼吸率文本
-                self.hr_value_label.setText(hr_text)  # 更新心率文本
+                # 数值没变时跳过setText（QLabel不做去重，相同文本也会重绘）
+                if br_text != self.br_value_label.text():
+                    self.br_value_label.setText(br_text)  # 更新呼吸率文本
+                if hr_text != self.hr_value_label.text():
+                    self.hr_value_label.setText(hr_text)  # 更新心率文本
                 
-                self.recorded_frames = self.recorded_frames[-824:]  # 只保留后824个点
-                # self.recorded_frames = self.recorded_frames[-1004:]  # 只保留后824个点
+                self._ring_fill = FRAME_KEEP  # 逻辑只保留后824帧，数据原地不动
                 
                 print(f"Update one point {self.num_points}")
             
         except Exception as e:
             print(f"Error in process_frames: {e}")
-            print(f"recorded_frames length: {len(self.recorded_frames)}")
-            if len(self.recorded_frames) > 0:
-                print(f"First frame shape: {np.array(self.recorded_frames[0]).shape}")
+            print(f"frames shape: {frames.shape}")
             # 清空有问题的数据，避免重复处理
-            self.recorded_frames = []
+            self._ring_fill = 0
+            self._prev_unwrapped = None
             self.progress_bar.setValue(0)
             # 显示默认值
             self.br_value_label.setText("--")
@@ -997,6 +1053,9 @@ class VitalSignsGUI(QMainWindow):
             return
         for fname in os.listdir(log_dir):
             fpath = os.path.join(log_dir, fname)
+            # 当前会话的日志句柄是打开状态，跳过（Windows上无法删除打开的文件）
+            if os.path.abspath(fpath) == os.path.abspath(self.log_file):
+                continue
             if os.path.isfile(fpath):
                 os.remove(fpath)  # 删除文件
         # 弹窗提示
@@ -1009,6 +1068,8 @@ class VitalSignsGUI(QMainWindow):
         确保在关闭窗口时正确停止数据采集和清理资源
         """
         self.stop_acquisition()  # 停止数据采集
+        self._io_pool.shutdown(wait=True)  # 等待未完成的落盘任务写完
+        self._log_fp.close()  # 刷出并关闭日志句柄
         event.accept()  # 接受关闭事件
 
 def main():
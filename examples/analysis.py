@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import fft as sp_fft
 from pathlib import Path
 import matplotlib.pyplot as plt
 import sys
@@ -102,11 +103,13 @@ print(f"  Extracted chirp data shape: {selected_chirp.shape}")
 # Apply a Hanning window to reduce FFT sidelobes
 # selected_chirp shape: (1024, 256), window shape: (256,)
 # Need to broadcast window to match selected_chirp dimensions
-window = np.hanning(num_adc_samples)  # Shape: (256,)
+window = np.hanning(num_adc_samples).astype(np.float32)  # Shape: (256,), keep the pipeline in FP32
 chirp_windowed = selected_chirp * window  # Shape: (1024, 256)
 
 # FFT along the ADC samples dimension
-range_fft_complex = np.fft.fft(chirp_windowed, n=num_adc_samples, axis=2)
+# (ADC samples are real float32, so rfft computes only the non-negative
+# half spectrum; scipy.fft splits the batch of chirps across worker threads)
+range_fft_complex = sp_fft.rfft(chirp_windowed, n=num_adc_samples, axis=2, workers=-1)
 
 # Calculate Magnitude (often plotted in dB, but linear magnitude first)
 # We only need the first half of the FFT result due to symmetry for real inputs
@@ -228,28 +231,36 @@ print(f"Using periodicity: {periodicity}")
 BR, HR = vital_analyzer.display3s(phase_unwrapped, periodicity)
 
 print(f"\nVital Signs Analysis Results:")
-# Process breathing rate data - remove outliers
-BR_filtered = BR.copy()
-mb = np.abs(np.mean(BR_filtered) - BR_filtered)
-while len(BR_filtered) > 1:
-    max_idx = np.argmax(mb)
-    max_val = mb[max_idx]
-    if max_val < 1:
-        break
-    BR_filtered = np.delete(BR_filtered, max_idx)
-    mb = np.abs(np.mean(BR_filtered) - BR_filtered)
-avg_br = np.mean(BR_filtered)
-
-# Process heart rate data - remove outliers
-HR_filtered = HR.copy()
-mb = np.abs(np.mean(HR_filtered) - HR_filtered)
-while len(HR_filtered) > 1:
-    max_idx = np.argmax(mb)
-    max_val = mb[max_idx]
-    if max_val < 1:
-        break
-    HR_filtered = np.delete(HR_filtered, max_idx)
-    mb = np.abs(np.mean(HR_filtered) - HR_filtered)
-avg_hr = np.mean(HR_filtered)
+
+
+def filter_outliers(values, threshold):
+    """
+    Iteratively drop the sample farthest from the mean until every
+    remaining deviation is below threshold, then return the mean.
+
+    Same pruning as the old argmax + np.delete loop, but works on a
+    boolean keep-mask with an incrementally updated sum instead of
+    reallocating the array every iteration.
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    keep = np.ones(vals.shape, dtype=bool)
+    dev = np.empty_like(vals)
+    total = vals.sum()
+    count = vals.size
+    while count > 1:
+        np.abs(total / count - vals, out=dev)
+        dev[~keep] = -1.0  # already-dropped samples never win the argmax
+        worst = np.argmax(dev)
+        if dev[worst] < threshold:
+            break
+        keep[worst] = False
+        total -= vals[worst]
+        count -= 1
+    return total / count
+
+
+# Remove outliers from breathing and heart rate estimates
+avg_br = filter_outliers(BR, 1)
+avg_hr = filter_outliers(HR, 1)
 
 print(f"Average BR={avg_br:.2f} BPM HR={avg_hr:.2f} BPM")
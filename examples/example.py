@@ -5,17 +5,18 @@ A recorder object is created to create 100 frames. The program blocks until the
 This file can then for example be loaded into a Jupyter Notebook (check out 
 example.ipynb).
 """
-from queue import Queue
 from datetime import datetime
 # Keep imports working although this file is iun subdir of the repo
 import sys, pathlib
 sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
 from adc_reader.adc_reader import AdcReader
 from adc_reader.utils.adc_recorder import ADCRecorder
+from adc_reader.utils.frame_buffer import FrameBuffer
 
 
-# Create the queue which the reader will write the ADC data into
-data_queue = Queue()
+# Create the buffer which the reader will write the ADC data into
+# (lock-free single-producer/single-consumer replacement for queue.Queue)
+data_queue = FrameBuffer()
 
 # Create xWRL6432AdcReader instance
 adc_reader = AdcReader(
@@ -28,7 +29,8 @@ adc_reader = AdcReader(
 # Create recorder instance to record 100 frames
 adc_recorder = ADCRecorder(
     input_queue=data_queue,
-    num_frames=1024
+    num_frames=1024,
+    release=adc_reader.release # recycle frame slabs back to the reader's pool
 )
 
 try:
@@ -11,7 +11,11 @@ class RangeBinAnalyzer:
     
     def __init__(self):
         """Initialize the RangeBinAnalyzer."""
-        pass
+        # Cached figure state: repeated displays update the line data in
+        # place instead of building a new figure (and backend state) per call
+        self._fig = None
+        self._lines = None
+        self._max_pts = None
     
     def range_bin(self, map_data, display_or_not=False):
         """
@@ -24,18 +28,20 @@ class RangeBinAnalyzer:
         Returns:
             int: Index of the range bin with maximum energy (0-based indexing)
         """
-        # Convert to numpy array if not already
-        map_data = np.array(map_data)
-        
-        # Calculate mean for each row (axis=0 means along columns for each row)
-        row_means = np.mean(map_data, axis=0, keepdims=True)
-        
-        # Calculate energy: sum of absolute differences from mean for each row
-        y = np.sum((map_data - row_means)**2, axis=0);
+        # Convert to numpy array if not already (no copy for ndarray input)
+        map_data = np.asarray(map_data)
+
+        # Calculate energy: sum of squared deviations from the per-bin mean.
+        # Uses sum((x-mu)^2) = sum(x^2) - sum(x)^2/N so only two reductions
+        # run over the data, without materializing the broadcast difference.
+        n = map_data.shape[0]
+        s = map_data.sum(axis=0, dtype=np.float64)
+        s2 = np.einsum('ijk,ijk->jk', map_data, map_data, dtype=np.float64)
+        y = s2 - s * s / n
         
         # Find maximum values and their indices for each row
-        max_values = np.max(y, axis=1)  # Get maximum values
         index = np.argmax(y, axis=1)    # Get indices of maximum values
+        max_values = y[np.arange(y.shape[0]), index]  # Gather maxima from the argmax result
         # 删除能量值小于阈值的索引
         valid_indices = max_values >= 5e7
         index = index[valid_indices]  # 只保留能量值大于阈值的索引
@@ -59,31 +65,50 @@ class RangeBinAnalyzer:
         """
         # Convert to dB scale
         # y_db = 10 * np.log10(y / np.max(y))
-        
+
+        x = np.arange(y.shape[1])
+        if self._fig is not None and plt.fignum_exists(self._fig.number):
+            # Reuse the cached figure: update artist data in place
+            ax = self._fig.axes[0]
+            for ch, line in enumerate(self._lines):
+                line.set_data(x, y[ch,:])
+            for ch, point in enumerate(self._max_pts):
+                point.set_data([max_index[ch]], [y[ch,max_index[ch]]])
+                point.set_label(f'RX{ch+1} Max at {max_index[ch]}')
+            ax.relim()
+            ax.autoscale_view()
+            ax.legend()
+            self._fig.canvas.draw_idle()
+            return
+
         # Create the plot
-        plt.figure(figsize=(10, 6))
-        plt.plot(y[0,:], linewidth=2, label='RX1')
-        plt.plot(y[1,:], linewidth=2, label='RX2')
-        plt.plot(y[2,:], linewidth=2, label='RX3')
-        
+        self._fig = plt.figure(figsize=(10, 6))
+        self._lines = [
+            plt.plot(x, y[0,:], linewidth=2, label='RX1')[0],
+            plt.plot(x, y[1,:], linewidth=2, label='RX2')[0],
+            plt.plot(x, y[2,:], linewidth=2, label='RX3')[0],
+        ]
+
         # Highlight the maximum point
         # Plot maximum points for each channel
-        plt.plot(max_index[0], y[0,max_index[0]], 'ro', markersize=8, label=f'RX1 Max at {max_index[0]}')
-        plt.plot(max_index[1], y[1,max_index[1]], 'go', markersize=8, label=f'RX2 Max at {max_index[1]}')
-        plt.plot(max_index[2], y[2,max_index[2]], 'yo', markersize=8, label=f'RX3 Max at {max_index[2]}')
-        
+        self._max_pts = [
+            plt.plot(max_index[0], y[0,max_index[0]], 'ro', markersize=8, label=f'RX1 Max at {max_index[0]}')[0],
+            plt.plot(max_index[1], y[1,max_index[1]], 'go', markersize=8, label=f'RX2 Max at {max_index[1]}')[0],
+            plt.plot(max_index[2], y[2,max_index[2]], 'yo', markersize=8, label=f'RX3 Max at {max_index[2]}')[0],
+        ]
+
         plt.title('Energy with static removing', fontsize=16)
         plt.xlabel('Range Bin Index', fontsize=16)
         plt.ylabel('dB', fontsize=16)
         # mplcursors.cursor(hover=True)
         plt.grid(True)
         plt.legend()
-        
+
         # Set font size for axes
         plt.tick_params(labelsize=14)
-        
+
         # Optional: set y-axis limits similar to MATLAB commented code
         # plt.ylim([-10, 0])
-        
+
         plt.tight_layout()
         plt.show()
\ No newline at end of file
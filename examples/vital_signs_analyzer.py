@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import fft as sp_fft
 import matplotlib.pyplot as plt
 
 class VitalSignsAnalyzer:
@@ -8,9 +9,28 @@ class VitalSignsAnalyzer:
     该类使用基于FFT的频谱分析来从相位数据中提取呼吸率(BR)和心率(HR)。
     """
     
-    def __init__(self):
-        """初始化生命体征分析器"""
-        pass
+    def __init__(self, window=None):
+        """
+        初始化生命体征分析器
+
+        参数:
+            window (numpy.ndarray, optional): 慢时间维加窗序列。None或全1
+                                              视为矩形窗，分析时跳过窗乘法。
+        """
+        # 构造时判定一次是否为恒等窗，热路径上无需再判断和相乘
+        if window is not None and np.all(window == 1.0):
+            window = None
+        self._window = window
+        # 按periodicity缓存的频率轴（会话内periodicity固定，只算一次）
+        self._f_cache = {}
+        # 呼吸/心率频段对应的FFT bin区间
+        self._br_bins = (13, 69)
+        self._hr_bins = (72, 344)
+        # 缓存的图窗和曲线句柄：重复显示时原地更新数据而非重建图窗
+        self._fig = None
+        self._lines_full = None
+        self._lines_br = None
+        self._lines_hr = None
     
     def display3s(self, phase, periodicity, display_or_not=True):
         """
@@ -24,39 +44,65 @@ class VitalSignsAnalyzer:
         返回:
             tuple: (BR, HR) - 呼吸率和心率(每分钟次数)
         """
-        # 创建频率数组
-        f = np.arange(1024) / 2048 / periodicity
-        
-        # 计算FFT
-        Y = np.abs(np.fft.fft(phase, 2048, axis=0))
-        Y = Y[:1024,:]  # 取前1024个点
+        # 频率数组按periodicity缓存，重复调用时直接复用
+        f = self._f_cache.get(periodicity)
+        if f is None:
+            f = np.arange(1024) / 2048 / periodicity
+            self._f_cache[periodicity] = f
+
+        # 慢时间加窗（矩形窗时直接跳过，省去一次广播乘法和中间数组）
+        if self._window is not None:
+            phase = phase * self._window[:, None]
+
+        # 计算FFT：相位是实序列，rfft只算非负频率半谱，运算量和内存减半；
+        # scipy的pocketfft后端比numpy.fft更快且形状不变时复用变换内核
+        Y = np.abs(sp_fft.rfft(phase, 2048, axis=0))
+        Y = Y[:1024,:]  # rfft返回1025个bin，取前1024个点与原切片一致
         
         # 将前13个点置零(去除直流分量和极低频)
         Y[:13,:] = 0
         
-        # 找到最大值并创建修改后的频谱Y2
-        x = np.argmax(Y,axis=0)
-        BY11 = np.zeros((1024,3))
-        BY11[13:69,:] = np.abs(Y[13:69,:])  # 调整为基于0的索引
-        
+        # 直接在频段切片上取argmax再加上偏移，省去零填充的BY11/BY21临时数组
+        br_lo, br_hi = self._br_bins
+        hr_lo, hr_hi = self._hr_bins
+
         # 找到呼吸率
-        x_br = np.argmax(BY11,axis=0)
+        x_br = br_lo + np.argmax(Y[br_lo:br_hi,:], axis=0)
         BR = f[x_br] * 60
-        
-        # 子图3: 心率分析(73-344范围)
-        BY21 = np.zeros((1024,3))
-        BY21[72:344,:] = np.abs(Y[72:344,:])  # 调整为基于0的索引
-        
-        # 找到心率
-        x_hr = np.argmax(BY21,axis=0)
+
+        # 找到心率(73-344范围)
+        x_hr = hr_lo + np.argmax(Y[hr_lo:hr_hi,:], axis=0)
         HR = f[x_hr] * 60
-        
-        # 仅在启用显示时创建三个子图
+
+        # 仅在启用显示时创建三个子图（零填充频谱只在绘图时才构造）
         if display_or_not:
-            fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 6))
-            
+            BY11 = np.zeros((1024,3))
+            BY11[br_lo:br_hi,:] = Y[br_lo:br_hi,:]
+            BY21 = np.zeros((1024,3))
+            BY21[hr_lo:hr_hi,:] = Y[hr_lo:hr_hi,:]
+
+            # 以分贝形式表示呼吸/心率频谱
+            BY11_max = np.max(BY11,axis=0)
+            BY11_db = 20 * np.log10(np.maximum(BY11, BY11_max * 1e-10) / BY11_max)
+            BY21_max = np.max(BY21,axis=0)
+            BY21_db = 20 * np.log10(np.maximum(BY21, BY21_max * 1e-10) / BY21_max)
+
+            if self._fig is not None and plt.fignum_exists(self._fig.number):
+                # 复用缓存的图窗：只原地更新曲线数据，不重建后端状态
+                for ch in range(3):
+                    self._lines_full[ch].set_ydata(Y[:,ch])
+                    self._lines_br[ch].set_ydata(BY11_db[:,ch])
+                    self._lines_hr[ch].set_ydata(BY21_db[:,ch])
+                ax1 = self._fig.axes[0]
+                ax1.relim()
+                ax1.autoscale_view(scalex=False)
+                self._fig.canvas.draw_idle()
+                return BR, HR
+
+            self._fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 6))
+
             # 子图1: 完整频谱
-            ax1.plot(f * 60, np.abs(Y), linewidth=1, label='Original')
+            self._lines_full = ax1.plot(f * 60, Y, linewidth=1, label='Original')
             ax1.set_title('Breathing Spectrum', fontsize=16)
             ax1.set_xlabel('Beats per minute', fontsize=14)
             ax1.set_ylabel('Magnitude (a.u.)', fontsize=14)
@@ -64,12 +110,9 @@ class VitalSignsAnalyzer:
             ax1.set_xlim([0, 200])
             ax1.legend(['RX1','RX2','RX3'])
             ax1.tick_params(labelsize=12)
-            
-            # 以分贝形式绘制呼吸频谱
-            BY11_max = np.max(BY11,axis=0)
-            BY11_db = 20 * np.log10(np.maximum(BY11, BY11_max * 1e-10) / BY11_max)
 
-            ax2.plot(f * 60, BY11_db, linewidth=1, label='Original')
+            # 子图2: 呼吸频谱(dB)
+            self._lines_br = ax2.plot(f * 60, BY11_db, linewidth=1, label='Original')
             ax2.set_title('Breathing Spectrum', fontsize=16)
             ax2.set_xlabel('Beats per minute', fontsize=14)
             ax2.set_ylabel('Magnitude (a.u.)/dB', fontsize=14)
@@ -78,12 +121,9 @@ class VitalSignsAnalyzer:
             ax2.set_ylim([-40, 0])
             ax2.legend(['RX1','RX2','RX3'])
             ax2.tick_params(labelsize=12)
-            
-            # 以分贝形式绘制心率频谱
-            BY21_max = np.max(BY21,axis=0)
-            BY21_db = 20 * np.log10(np.maximum(BY21, BY21_max * 1e-10) / BY21_max)
-            
-            ax3.plot(f * 60, BY21_db, linewidth=1, label='Original')
+
+            # 子图3: 心率频谱(dB)
+            self._lines_hr = ax3.plot(f * 60, BY21_db, linewidth=1, label='Original')
             ax3.set_title('Heart Rate Spectrum', fontsize=16)
             ax3.set_xlabel('Beats per minute', fontsize=14)
             ax3.set_ylabel('Magnitude (a.u.)/dB', fontsize=14)
@@ -92,8 +132,8 @@ class VitalSignsAnalyzer:
             ax3.set_ylim([-40, 0])
             ax3.legend(['RX1','RX2','RX3'])
             ax3.tick_params(labelsize=12)
-            
+
             plt.tight_layout()
             plt.show()
-        
+
         return BR, HR
\ No newline at end of file